@@ -6,79 +6,338 @@ Demonstrates how to create interactive notifications with action buttons
 and handle user responses.
 """
 
-import time
+import asyncio
+import contextlib
+import functools
 import subprocess
-from desktop_notify import send_notification, NotificationManager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Final, List, Optional, Tuple
 
+from desktop_notify import NotificationManager
+from desktop_notify.api import get_notification_manager
 
-def basic_actions_example():
+
+# Notification sends block on the backend (and, for interactive ones, on the
+# user), so they run on a small worker pool while the event loop keeps going.
+_EXECUTOR: Final = ThreadPoolExecutor(max_workers=4)
+
+# Extra time allowed on top of a notification's own timeout before the send is
+# treated as hung, and the limit used when no timeout is given.
+SEND_GRACE_SECONDS: Final[float] = 5.0
+DEFAULT_SEND_LIMIT_SECONDS: Final[float] = 10.0
+
+
+@functools.lru_cache(maxsize=1)
+def _backend_info() -> Optional[Dict[str, Any]]:
+    """
+    Probe the notification backend once and reuse the answer.
+    
+    Call _backend_info.cache_clear() to force a fresh probe.
+    """
+    manager = get_notification_manager()
+    if not manager.is_available():
+        return None
+    return manager.get_backend_info()
+
+
+async def send_notification_async(
+    *args: Any, sender: Optional[Callable[..., Any]] = None, **kwargs: Any
+) -> Any:
+    """Run a blocking send on the worker pool (the shared manager by default)."""
+    sender = sender or get_notification_manager().send
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _EXECUTOR, functools.partial(sender, *args, **kwargs)
+    )
+
+
+async def notify(
+    *args: Any, sender: Optional[Callable[..., Any]] = None, **kwargs: Any
+) -> Any:
+    """
+    Send a notification without blocking the event loop.
+    
+    A backend that never answers (e.g. no notification daemon on the bus) is
+    reported as "no response" instead of stalling the examples.
+    """
+    timeout_ms = kwargs.get("timeout")
+    limit = (timeout_ms / 1000 if timeout_ms else DEFAULT_SEND_LIMIT_SECONDS) + SEND_GRACE_SECONDS
+    
+    try:
+        return await asyncio.wait_for(
+            send_notification_async(*args, sender=sender, **kwargs), timeout=limit
+        )
+    except asyncio.TimeoutError:
+        print(f"⏰ No response from notification backend after {limit:.0f}s")
+        return None
+
+
+class NotificationStack:
+    """
+    Fold rapid updates to the same notification_id into a single send.
+    
+    Updates are collected for `window` seconds and then only the latest one
+    per ID is sent. A single drain task owns the pending updates: it takes
+    them, sends them, and goes round again if more arrived meanwhile.
+    flush() cuts the current window short and waits until all are sent.
+    """
+    
+    def __init__(self, window: float = 0.5) -> None:
+        self.window = window
+        self._pending: Dict[str, Tuple[Tuple[Any, ...], Dict[str, Any]]] = {}
+        self._drain: Optional[asyncio.Task] = None
+        self._send_now = asyncio.Event()
+    
+    async def send(self, notification_id: str, *args: Any, **kwargs: Any) -> None:
+        """Queue an update for notification_id (replacing one still waiting)."""
+        self._pending[notification_id] = (args, kwargs)
+        if self._drain is None or self._drain.done():
+            self._drain = asyncio.create_task(self._drain_pending())
+    
+    async def flush(self) -> None:
+        """Send all pending updates now and wait until they are out."""
+        if self._drain is not None and not self._drain.done():
+            self._send_now.set()
+            await self._drain
+    
+    async def _drain_pending(self) -> None:
+        while self._pending:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._send_now.wait(), self.window)
+            self._send_now.clear()
+            
+            pending, self._pending = self._pending, {}
+            for notification_id, (args, kwargs) in pending.items():
+                await notify(*args, notification_id=notification_id, **kwargs)
+
+
+class NotifFSM:
+    """
+    Lifecycle of one interactive notification.
+    
+        idle --start()--> pending --on_action(id)--> committed
+                                  --on_timeout()---> aborted
+    
+    A timeout always resolves to aborted, never to an implicit choice.
+    Whichever event arrives first wins; later events are ignored. Entering
+    committed runs the handler registered for the chosen action on the
+    worker pool.
+    """
+    
+    IDLE: Final = "idle"
+    PENDING: Final = "pending"
+    COMMITTED: Final = "committed"
+    ABORTED: Final = "aborted"
+    
+    def __init__(self, handlers: "ActionHandlers") -> None:
+        self.handlers = handlers
+        self.state = self.IDLE
+        self.action_id: Optional[str] = None
+        self._resolved = asyncio.Event()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._effect: Optional[Awaitable[None]] = None
+    
+    def start(self, timeout: float) -> None:
+        """Enter pending and arm the timeout (in seconds)."""
+        if self.state != self.IDLE:
+            return
+        self.state = self.PENDING
+        self._timer = asyncio.get_running_loop().call_later(timeout, self.on_timeout)
+    
+    def bind(self, send: "asyncio.Future[Any]") -> None:
+        """Feed the result of an in-flight send into the machine."""
+        def resolve(done: "asyncio.Future[Any]") -> None:
+            if done.cancelled():
+                return
+            result = done.result()
+            if result:
+                self.on_action(result)
+            else:
+                self.on_timeout()
+        
+        send.add_done_callback(resolve)
+    
+    def on_action(self, action_id: str) -> None:
+        """pending -> committed"""
+        if self.state != self.PENDING:
+            return
+        self.state = self.COMMITTED
+        self.action_id = action_id
+        self._finish()
+        handler = self.handlers.get(action_id)
+        if handler is not None:
+            self._effect = asyncio.get_running_loop().run_in_executor(_EXECUTOR, handler)
+    
+    def on_timeout(self) -> None:
+        """pending -> aborted"""
+        if self.state != self.PENDING:
+            return
+        self.state = self.ABORTED
+        self._finish()
+    
+    async def wait(self) -> str:
+        """Wait for a terminal state (and its handler) and return it."""
+        await self._resolved.wait()
+        if self._effect is not None:
+            await self._effect
+        return self.state
+    
+    def _finish(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._resolved.set()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Action definitions (action_id -> button label)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+ActionLabels = Dict[str, str]
+
+CONFIRM_ACTIONS: Final[ActionLabels] = {"yes": "Yes", "no": "No"}
+DOWNLOAD_ACTIONS: Final[ActionLabels] = {
+    "open": "Open File",
+    "folder": "Open Folder",
+    "share": "Share",
+    "dismiss": "Dismiss"
+}
+CALL_ACTIONS: Final[ActionLabels] = {
+    "answer": "Answer",
+    "decline": "Decline",
+    "message": "Send Message"
+}
+BACKUP_ACTIONS: Final[ActionLabels] = {"yes": "Start Backup", "no": "Cancel"}
+RETRY_ACTIONS: Final[ActionLabels] = {
+    "retry": "Retry",
+    "details": "Show Details",
+    "cancel": "Cancel"
+}
+SETTINGS_ACTIONS: Final[ActionLabels] = {"open": "Open Settings", "restart": "Restart App", "ok": "OK"}
+
+# How long an incoming call rings before it counts as missed
+CALL_TIMEOUT_MS: Final[int] = 30000
+
+# Files the simulated backup reports progress for, and how long each takes
+# (seconds); 20 x 0.1 s spans four NotificationStack windows
+BACKUP_FILE_COUNT: Final[int] = 20
+BACKUP_FILE_SECONDS: Final[float] = 0.1
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Action handlers
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _open_file() -> None:
+    print("📂 Opening file...")
+    # In real app: subprocess.run(["xdg-open", "/path/to/file.pdf"])
+
+
+def _open_folder() -> None:
+    print("📁 Opening download folder...")
+    # In real app: subprocess.run(["xdg-open", "/downloads/"])
+
+
+def _share_file() -> None:
+    print("📤 Sharing file...")
+    # In real app: open share dialog
+
+
+def _answer_call() -> None:
+    print("📞 Answering call...")
+    # Show call answered notification
+    get_notification_manager().send("phone", "Call Active", "Connected to John Doe")
+
+
+def _decline_call() -> None:
+    print("📵 Declining call...")
+    # Show call declined notification
+    get_notification_manager().send("phone", "Call Declined", "Call from John Doe declined")
+
+
+def _message_caller() -> None:
+    print("💬 Sending quick message...")
+    # Show message sent notification
+    get_notification_manager().send("message", "Message Sent", "Quick reply sent to John Doe")
+
+
+def _open_settings() -> None:
+    print("🔧 Opening settings...")
+
+
+def _restart_app() -> None:
+    print("🔄 Restarting application...")
+
+
+# action_id -> handler, built once; actions without a handler (e.g. "dismiss")
+# are ignored
+ActionHandlers = Dict[str, Callable[[], None]]
+
+DOWNLOAD_HANDLERS: Final[ActionHandlers] = {"open": _open_file, "folder": _open_folder, "share": _share_file}
+CALL_HANDLERS: Final[ActionHandlers] = {"answer": _answer_call, "decline": _decline_call, "message": _message_caller}
+SETTINGS_HANDLERS: Final[ActionHandlers] = {"open": _open_settings, "restart": _restart_app}
+
+
+def dispatch_action(handlers: ActionHandlers, action_id: str) -> None:
+    """Run the handler registered for action_id, if any."""
+    handler = handlers.get(action_id)
+    if handler is not None:
+        handler()
+
+
+handle_download_action = functools.partial(dispatch_action, DOWNLOAD_HANDLERS)
+handle_settings_action = functools.partial(dispatch_action, SETTINGS_HANDLERS)
+
+
+async def basic_actions_example() -> None:
     """Simple yes/no action example."""
     print("📋 Basic Actions Example")
     print("=" * 50)
     
-    # Define actions
-    actions = {"yes": "Yes", "no": "No"}
-    
     # Send interactive notification
-    result = send_notification(
+    result = await notify(
         icon="question",
         title="Confirmation Required",
         message="Do you want to proceed with the operation?",
-        actions=actions,
+        actions=CONFIRM_ACTIONS,
         timeout=10000  # 10 seconds
     )
     
     # Handle response
     if result == "yes":
         print("✅ User confirmed the operation")
-        send_notification("success", "Confirmed", "Operation proceeding...")
+        await notify("success", "Confirmed", "Operation proceeding...")
     elif result == "no":
         print("❌ User cancelled the operation")
-        send_notification("info", "Cancelled", "Operation cancelled")
+        await notify("info", "Cancelled", "Operation cancelled")
     else:
         print("⏰ User didn't respond (timeout)")
-        send_notification("warning", "Timeout", "No response received")
+        await notify("warning", "Timeout", "No response received")
     
     print()
 
 
-def file_download_example():
+async def file_download_example() -> None:
     """File download with action buttons."""
     print("📥 File Download Example")
     print("=" * 50)
     
-    def handle_download_action(action_id):
-        """Handle download completion actions."""
-        if action_id == "open":
-            print("📂 Opening file...")
-            # In real app: subprocess.run(["xdg-open", "/path/to/file.pdf"])
-        elif action_id == "folder":
-            print("📁 Opening download folder...")
-            # In real app: subprocess.run(["xdg-open", "/downloads/"])
-        elif action_id == "share":
-            print("📤 Sharing file...")
-            # In real app: open share dialog
-    
-    # Simulate download progress
-    send_notification("download", "Download Started", "Downloading document.pdf...")
+    # Simulate download progress; the "started" notification is delivered
+    # while the download runs
+    started = asyncio.create_task(
+        notify("download", "Download Started", "Downloading document.pdf...")
+    )
     
     # Simulate download time
     print("Simulating download...")
-    time.sleep(2)
+    await asyncio.sleep(2)
+    await started
     
     # Download complete with actions
-    download_actions = {
-        "open": "Open File",
-        "folder": "Open Folder", 
-        "share": "Share",
-        "dismiss": "Dismiss"
-    }
-    
-    result = send_notification(
+    result = await notify(
         icon="success",
         title="Download Complete",
         message="document.pdf has been downloaded successfully",
-        actions=download_actions,
+        actions=DOWNLOAD_ACTIONS,
         action_callback=handle_download_action,
         timeout=15000
     )
@@ -87,166 +346,145 @@ def file_download_example():
     print()
 
 
-def call_notification_example():
+async def call_notification_example() -> None:
     """Incoming call notification with answer/decline."""
     print("📞 Call Notification Example")
     print("=" * 50)
     
-    def handle_call_action(action_id):
-        """Handle call actions."""
-        if action_id == "answer":
-            print("📞 Answering call...")
-            # Show call answered notification
-            send_notification("phone", "Call Active", "Connected to John Doe")
-        elif action_id == "decline":
-            print("📵 Declining call...")
-            # Show call declined notification  
-            send_notification("phone", "Call Declined", "Call from John Doe declined")
-        elif action_id == "message":
-            print("💬 Sending quick message...")
-            # Show message sent notification
-            send_notification("message", "Message Sent", "Quick reply sent to John Doe")
+    # The call rings for CALL_TIMEOUT_MS; answering, declining or messaging
+    # commits the call, and running out of time aborts it as missed
+    call = NotifFSM(CALL_HANDLERS)
+    call.start(CALL_TIMEOUT_MS / 1000)
     
     # Incoming call with multiple actions
-    call_actions = {
-        "answer": "Answer",
-        "decline": "Decline",
-        "message": "Send Message"
-    }
-    
-    result = send_notification(
+    ringing = asyncio.create_task(notify(
         icon="phone",
         title="Incoming Call",
         message="John Doe is calling...",
-        actions=call_actions,
-        action_callback=handle_call_action,
+        actions=CALL_ACTIONS,
         urgency="critical",
-        timeout=30000  # 30 seconds for call timeout
-    )
+        timeout=CALL_TIMEOUT_MS
+    ))
+    call.bind(ringing)
     
-    if result is None:
+    if await call.wait() == NotifFSM.ABORTED:
+        ringing.cancel()
         print("📵 Call timed out")
-        send_notification("phone", "Missed Call", "Missed call from John Doe")
+        await notify("phone", "Missed Call", "Missed call from John Doe")
     
     print()
 
 
-def backup_confirmation_example():
-    """Backup operation with confirmation."""
-    print("💾 Backup Confirmation Example")
-    print("=" * 50)
-    
-    def perform_backup():
-        """Simulate backup operation."""
-        print("Starting backup process...")
-        
-        # Backup in progress
-        send_notification(
+async def _perform_backup() -> None:
+    """Simulate backup operation."""
+    print("Starting backup process...")
+
+    # Every update shares the "backup" ID, so route them through a stack:
+    # several files finish per window, and each window sends only the
+    # latest one, so the notification steps through the backup a few files
+    # at a time
+    stack = NotificationStack()
+    
+    # Backup in progress (simulated files)
+    for number in range(1, BACKUP_FILE_COUNT + 1):
+        await stack.send(
+            "backup",
             "info",
             "Backup In Progress",
-            "Backing up files to cloud storage...",
-            notification_id="backup"
-        )
-        
-        # Simulate backup time
-        time.sleep(3)
-        
-        # Backup complete
-        send_notification(
-            "success",
-            "Backup Complete",
-            "All files successfully backed up",
-            notification_id="backup"
+            f"Backing up file {number} of {BACKUP_FILE_COUNT} to cloud storage..."
         )
+        await asyncio.sleep(BACKUP_FILE_SECONDS)
+    
+    # Backup complete
+    await stack.send(
+        "backup",
+        "success",
+        "Backup Complete",
+        "All files successfully backed up"
+    )
+    await stack.flush()
+
+
+async def backup_confirmation_example() -> None:
+    """Backup operation with confirmation."""
+    print("💾 Backup Confirmation Example")
+    print("=" * 50)
     
     # Ask for confirmation
-    backup_actions = {"yes": "Start Backup", "no": "Cancel"}
-    
-    result = send_notification(
+    result = await notify(
         icon="question",
         title="Backup Confirmation",
         message="Backup all files to cloud storage? This may take several minutes.",
-        actions=backup_actions,
+        actions=BACKUP_ACTIONS,
         timeout=15000
     )
     
     if result == "yes":
         print("✅ User confirmed backup")
-        perform_backup()
+        await _perform_backup()
     else:
         print("❌ Backup cancelled")
-        send_notification("info", "Backup Cancelled", "No backup performed")
+        await notify("info", "Backup Cancelled", "No backup performed")
     
     print()
 
 
-def multi_step_workflow_example():
+# Workflow steps: state -> notification shown for that state
+WORKFLOW_STEPS: Final[Dict[str, Dict[str, Any]]] = {
+    "step1": {
+        "icon": "info",
+        "title": "Step 1 of 3",
+        "message": "Initialize project setup?",
+        "actions": {"continue": "Continue", "cancel": "Cancel"},
+    },
+    "step2": {
+        "icon": "info",
+        "title": "Step 2 of 3",
+        "message": "Configure project settings?",
+        "actions": {"continue": "Continue", "back": "Go Back", "cancel": "Cancel"},
+    },
+    "step3": {
+        "icon": "question",
+        "title": "Step 3 of 3",
+        "message": "Ready to finalize project setup?",
+        "actions": {"finish": "Finish", "back": "Go Back", "cancel": "Cancel"},
+    },
+}
+
+# (state, action) -> next state; anything not listed cancels the workflow
+WORKFLOW_TRANSITIONS: Final[Dict[Tuple[str, Optional[str]], str]] = {
+    ("step1", "continue"): "step2",
+    ("step2", "continue"): "step3",
+    ("step2", "back"): "step1",
+    ("step3", "finish"): "done",
+    ("step3", "back"): "step2",
+}
+
+# Attempt on which the simulated operation in error_handling_example succeeds
+SUCCEEDS_ON_ATTEMPT: Final[int] = 3
+
+
+async def multi_step_workflow_example() -> None:
     """Multi-step workflow with actions."""
     print("🔄 Multi-Step Workflow Example")
     print("=" * 50)
     
-    def step_one():
-        """First step of workflow."""
-        actions = {"continue": "Continue", "cancel": "Cancel"}
-        
-        result = send_notification(
-            icon="info",
-            title="Step 1 of 3",
-            message="Initialize project setup?",
-            actions=actions,
-            timeout=10000
-        )
-        
-        if result == "continue":
-            return step_two()
-        else:
-            send_notification("info", "Cancelled", "Workflow cancelled at step 1")
-            return False
-    
-    def step_two():
-        """Second step of workflow."""
-        actions = {"continue": "Continue", "back": "Go Back", "cancel": "Cancel"}
+    # Drive the workflow from the transition table, so going back and forth
+    # between steps does not nest calls
+    state = "step1"
+    while state in WORKFLOW_STEPS:
+        result = await notify(**WORKFLOW_STEPS[state], timeout=10000)
+        next_state = WORKFLOW_TRANSITIONS.get((state, result), "cancel")
         
-        result = send_notification(
-            icon="info",
-            title="Step 2 of 3",
-            message="Configure project settings?",
-            actions=actions,
-            timeout=10000
-        )
+        if next_state == "cancel":
+            step_number = state[-1]
+            await notify("info", "Cancelled", f"Workflow cancelled at step {step_number}")
         
-        if result == "continue":
-            return step_three()
-        elif result == "back":
-            return step_one()
-        else:
-            send_notification("info", "Cancelled", "Workflow cancelled at step 2")
-            return False
+        state = next_state
     
-    def step_three():
-        """Final step of workflow."""
-        actions = {"finish": "Finish", "back": "Go Back", "cancel": "Cancel"}
-        
-        result = send_notification(
-            icon="question",
-            title="Step 3 of 3",
-            message="Ready to finalize project setup?",
-            actions=actions,
-            timeout=10000
-        )
-        
-        if result == "finish":
-            send_notification("success", "Complete", "Project setup finished!")
-            return True
-        elif result == "back":
-            return step_two()
-        else:
-            send_notification("info", "Cancelled", "Workflow cancelled at step 3")
-            return False
-    
-    # Start workflow
-    success = step_one()
+    success = state == "done"
     if success:
+        await notify("success", "Complete", "Project setup finished!")
         print("✅ Workflow completed successfully")
     else:
         print("❌ Workflow was cancelled")
@@ -254,52 +492,46 @@ def multi_step_workflow_example():
     print()
 
 
-def error_handling_example():
+async def error_handling_example() -> None:
     """Error handling with retry actions."""
     print("⚠️ Error Handling Example")
     print("=" * 50)
     
-    def simulate_operation(attempt=1):
-        """Simulate an operation that might fail."""
+    success = False
+    attempt = 1
+    while True:
         print(f"Attempting operation (attempt {attempt})...")
         
-        # Simulate failure on first two attempts
-        if attempt < 3:
-            error_actions = {
-                "retry": "Retry",
-                "details": "Show Details",
-                "cancel": "Cancel"
-            }
-            
-            result = send_notification(
-                icon="error",
-                title=f"Operation Failed (Attempt {attempt})",
-                message="Network connection failed. Would you like to retry?",
-                actions=error_actions,
-                urgency="critical",
-                timeout=15000
+        # Simulate failure until the configured attempt
+        if attempt >= SUCCEEDS_ON_ATTEMPT:
+            await notify("success", "Success", "Operation completed successfully!")
+            success = True
+            break
+        
+        result = await notify(
+            icon="error",
+            title=f"Operation Failed (Attempt {attempt})",
+            message="Network connection failed. Would you like to retry?",
+            actions=RETRY_ACTIONS,
+            urgency="critical",
+            timeout=15000
+        )
+        
+        if result == "retry":
+            await asyncio.sleep(1)
+            attempt += 1
+        elif result == "details":
+            await notify(
+                "info",
+                "Error Details",
+                "Connection timeout after 30 seconds. Check network settings.",
+                timeout=10000
             )
-            
-            if result == "retry":
-                time.sleep(1)
-                return simulate_operation(attempt + 1)
-            elif result == "details":
-                send_notification(
-                    "info",
-                    "Error Details",
-                    "Connection timeout after 30 seconds. Check network settings.",
-                    timeout=10000
-                )
-                return simulate_operation(attempt)  # Show options again
-            else:
-                send_notification("info", "Cancelled", "Operation cancelled by user")
-                return False
+            # Show options again for the same attempt
         else:
-            # Success on third attempt
-            send_notification("success", "Success", "Operation completed successfully!")
-            return True
+            await notify("info", "Cancelled", "Operation cancelled by user")
+            break
     
-    success = simulate_operation()
     if success:
         print("✅ Operation eventually succeeded")
     else:
@@ -308,7 +540,7 @@ def error_handling_example():
     print()
 
 
-def advanced_notification_manager_example():
+async def advanced_notification_manager_example() -> None:
     """Advanced example using NotificationManager."""
     print("🔧 Advanced NotificationManager Example")
     print("=" * 50)
@@ -321,7 +553,7 @@ def advanced_notification_manager_example():
     )
     
     # Check if actions are supported
-    backend_info = manager.get_backend_info()
+    backend_info = _backend_info()
     supports_actions = "actions" in backend_info.get("features", [])
     
     print(f"Current backend: {backend_info['name']}")
@@ -329,26 +561,20 @@ def advanced_notification_manager_example():
     
     if supports_actions:
         # Interactive notification
-        def handle_settings_action(action_id):
-            if action_id == "open":
-                print("🔧 Opening settings...")
-            elif action_id == "restart":
-                print("🔄 Restarting application...")
-                
-        settings_actions = {"open": "Open Settings", "restart": "Restart App", "ok": "OK"}
-        
-        result = manager.send(
+        result = await notify(
+            sender=manager.send,
             icon="settings",
             title="Configuration Updated",
             message="New settings have been applied. Restart recommended.",
-            actions=settings_actions,
+            actions=SETTINGS_ACTIONS,
             action_callback=handle_settings_action
         )
         
         print(f"User response: {result}")
     else:
         # Fallback for backends without action support
-        manager.send(
+        await notify(
+            sender=manager.send,
             icon="settings",
             title="Configuration Updated", 
             message="New settings applied. Please restart the application.",
@@ -359,51 +585,57 @@ def advanced_notification_manager_example():
     print()
 
 
-def main():
+# Examples in the order they run, and the minimum time given to each
+EXAMPLES: Final[List[Callable[[], Awaitable[None]]]] = [
+    basic_actions_example,
+    file_download_example,
+    call_notification_example,
+    backup_confirmation_example,
+    multi_step_workflow_example,
+    error_handling_example,
+    advanced_notification_manager_example,
+]
+EXAMPLE_SLOT_SECONDS: Final[float] = 1.0
+
+
+async def run_examples() -> None:
     """Run all interactive action examples."""
     print("🔔 Desktop Notify - Interactive Actions Examples")
     print("=" * 60)
     print()
     
     # Check if notifications are available
-    from desktop_notify import is_notifications_available
-    if not is_notifications_available():
+    if _backend_info() is None:
         print("❌ Desktop notifications are not available on this system")
         print("Please install a notification daemon (e.g., dunst) and try again")
         return
     
-    # Introduction notification
-    send_notification(
+    # Introduction notification (not awaited - the first example starts
+    # while it is still being delivered)
+    intro = asyncio.create_task(notify(
         "info",
         "Interactive Examples",
         "Starting interactive notification examples...",
         timeout=3000
-    )
+    ))
     
     try:
-        # Run examples
-        basic_actions_example()
-        time.sleep(1)
+        # Run examples, keeping each one on screen for at least
+        # EXAMPLE_SLOT_SECONDS; an example that already took longer than
+        # that is followed by the next one straight away
+        loop = asyncio.get_running_loop()
+        next_slot = loop.time()
         
-        file_download_example()
-        time.sleep(1)
-        
-        call_notification_example()
-        time.sleep(1)
-        
-        backup_confirmation_example()
-        time.sleep(1)
-        
-        multi_step_workflow_example()
-        time.sleep(1)
-        
-        error_handling_example()
-        time.sleep(1)
-        
-        advanced_notification_manager_example()
+        for example in EXAMPLES:
+            delay = next_slot - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            
+            next_slot = loop.time() + EXAMPLE_SLOT_SECONDS
+            await example()
         
         # Completion notification
-        send_notification(
+        await notify(
             "success",
             "Examples Complete",
             "All interactive notification examples finished!",
@@ -412,13 +644,23 @@ def main():
         
         print("✅ All examples completed successfully!")
         
-    except KeyboardInterrupt:
-        print("\n\n⚠️ Examples interrupted by user")
-        send_notification("warning", "Interrupted", "Examples stopped by user")
     except Exception as e:
         print(f"\n\n❌ Error running examples: {e}")
-        send_notification("error", "Error", f"Example failed: {e}")
+        await notify("error", "Error", f"Example failed: {e}")
+    finally:
+        await intro
+
+
+def main() -> None:
+    """Run the examples on an event loop."""
+    try:
+        asyncio.run(run_examples())
+    except KeyboardInterrupt:
+        print("\n\n⚠️ Examples interrupted by user")
+        get_notification_manager().send("warning", "Interrupted", "Examples stopped by user")
+    finally:
+        _EXECUTOR.shutdown(wait=False)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -10,15 +10,54 @@ VERSION: 1.0.0
 Main API interface for desktop notification system.
 """
 
+import atexit
+import dataclasses
+import functools
+import itertools
 import logging
+import os
+import queue
+import threading
 import time
-from typing import Any, Dict, List, Optional, Callable, Union
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Callable, Tuple, Union
 
-from .backends.discovery import BackendDiscovery
-from .iconsets.manager import get_icon_set_manager
+from .backends.base import NotificationBackend
+from .backends.discovery import get_backend_discovery
+from .iconsets.cache import IconResolutionCache, get_icon_resolution_cache
+from .iconsets.manager import IconSetManager, get_icon_set_manager
 from .config import get_config
 from .exceptions import DesktopNotifyError, BackendError, IconError
-from .types import NotificationResult, IconResolutionInfo
+from .types import NotificationResult, IconResolutionInfo, IconResolutionSource
+
+
+# Shared by every NotificationManager instead of looked up per instance
+_LOG = logging.getLogger(__name__)
+
+# Most queued notifications handed to the backend in one call
+MAX_SEND_BATCH = 32
+
+# Longest wait (seconds) for queued notifications when the program exits
+EXIT_FLUSH_TIMEOUT = 5.0
+
+# How long (seconds) a backend availability check is trusted
+AVAILABILITY_TTL = 5.0
+
+# Icons given as files rather than names
+FILE_ICON_PREFIXES = ("/", "~", "file://")
+
+
+def _settle_waiting(waiting: List[Future], sent: Future) -> None:
+    """Give every caller whose update was coalesced the outcome of the one sent."""
+    for waiter in waiting:
+        if waiter.done():
+            continue  # cancelled by the caller
+        if sent.cancelled():
+            waiter.cancel()
+        elif sent.exception() is not None:
+            waiter.set_exception(sent.exception())
+        else:
+            waiter.set_result(sent.result())
 
 
 class NotificationManager:
@@ -31,13 +70,47 @@ class NotificationManager:
     ///////////////////////////////////////////////////////////////////
     Advanced notification manager with configurable backends and icons.
     """
-    
+
+    __slots__ = (
+        "logger",
+        "config",
+        "backend_discovery",
+        "preferred_backend",
+        "preferred_icon_set",
+        "default_timeout",
+        "default_urgency",
+        "_log_icon_resolution",
+        "_track_last_result",
+        "_collect_timings",
+        "_backend",
+        "_backend_ready",
+        "_availability",
+        "_icon_manager",
+        "_icon_manager_ready",
+        "_last_notification_result",
+        "_icon_cache",
+        "_persistent_icons",
+        "_last_resolved_icon",
+        "_icon_sets",
+        "background",
+        "_outbox",
+        "_outbox_lock",
+        "_sender",
+        "_outbox_seq",
+        "_queued_ids",
+        "_coalesce_window",
+        "_pending",
+        "_pending_lock",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         backend: str = "auto",
         icon_set: str = "auto",
         timeout: Optional[int] = None,
         urgency: str = "normal",
+        background: bool = False,
         **kwargs
     ):
         """
@@ -48,9 +121,12 @@ class NotificationManager:
             icon_set: Icon set name ("auto", "system", "material", "minimal")
             timeout: Default timeout in milliseconds
             urgency: Default urgency level ("low", "normal", "critical")
+            background: Deliver notifications without actions from a
+                        background thread; send() then returns True as
+                        soon as the notification is queued
             **kwargs: Additional configuration options
         """
-        self.logger = logging.getLogger(__name__)
+        self.logger = _LOG
         
         # ─────────────────────────────────────────────────────────────────
         # Load configuration
@@ -58,9 +134,9 @@ class NotificationManager:
         self.config = get_config()
         
         # ─────────────────────────────────────────────────────────────────
-        # Initialize backend discovery
+        # Backend discovery (shared, so backends are probed once per process)
         # ─────────────────────────────────────────────────────────────────
-        self.backend_discovery = BackendDiscovery()
+        self.backend_discovery = get_backend_discovery()
         
         # ─────────────────────────────────────────────────────────────────
         # Set configuration overrides from parameters
@@ -70,17 +146,88 @@ class NotificationManager:
         self.default_timeout = timeout if timeout is not None else self.config.timeout
         self.default_urgency = urgency if urgency != "normal" else self.config.urgency
         
+        # Read once; checked on every icon resolution
+        self._log_icon_resolution = bool(getattr(self.config, "log_icon_resolution", False))
+        
+        # When off, send() skips building a NotificationResult for
+        # notifications without actions (get_last_notification_result()
+        # then only reflects send_detailed() calls)
+        self._track_last_result = bool(getattr(self.config, "track_last_result", True))
+        
+        # When off, send_time_ms/total_time_ms are left unset
+        self._collect_timings = bool(getattr(self.config, "collect_timings", True))
+        
         # ─────────────────────────────────────────────────────────────────
-        # Initialize components
+        # Components are set up on first use (see the backend and
+        # icon_manager properties), so creating a manager probes nothing
         # ─────────────────────────────────────────────────────────────────
-        self.backend = None
-        self.icon_manager = None
+        self._backend: Optional[NotificationBackend] = None
+        self._backend_ready = False
+        self._availability: Optional[Tuple[float, bool]] = None  # (checked at, result)
+        self._icon_manager: Optional[IconSetManager] = None
+        self._icon_manager_ready = False
         self._last_notification_result: Optional[NotificationResult] = None
         
-        self._initialize_backend()
-        self._initialize_icon_manager()
+        # Icon name -> resolution, keyed by the icon set active at the time
+        self._icon_cache: Dict[Tuple[Optional[str], str], IconResolutionInfo] = {}
+        self._last_resolved_icon: Optional[IconResolutionInfo] = None
+        
+        # Resolutions kept on disk between runs (opt-in; the file is read
+        # once per process and shared by all managers)
+        self._persistent_icons: Optional[IconResolutionCache] = None
+        if getattr(self.config, "icon_persistent_cache", False):
+            # System theme lookups depend on these settings too
+            self._persistent_icons = get_icon_resolution_cache((
+                self.config.system_icon_theme,
+                self.config.system_icon_size,
+                self.config.system_prefer_scalable,
+            ))
+        
+        self._icon_sets: Optional[Tuple[str, ...]] = None
         
-        self.logger.debug(f"NotificationManager initialized with backend: {self.backend.name if self.backend else 'None'}")
+        # ─────────────────────────────────────────────────────────────────
+        # Background delivery (sender thread started on first queued send)
+        # ─────────────────────────────────────────────────────────────────
+        self.background = background
+        self._outbox: Optional[queue.PriorityQueue] = None
+        self._outbox_lock = threading.Lock()
+        self._sender: Optional[threading.Thread] = None
+        self._outbox_seq = itertools.count()
+        # notification_id -> queue position of its latest queued update
+        self._queued_ids: Dict[str, Tuple[int, int, int]] = {}
+        
+        # Queued updates to the same notification_id within this window
+        # (seconds) collapse into the latest one; 0 sends every update
+        self._coalesce_window = max(0, getattr(self.config, "coalesce_window_ms", 0) or 0) / 1000
+        self._pending: Dict[str, list] = {}
+        self._pending_lock = threading.Lock()
+        
+        self.logger.debug("NotificationManager created (preferred backend: %s)", self.preferred_backend)
+    
+    @property
+    def backend(self) -> Optional[NotificationBackend]:
+        """Active notification backend, discovered on first access."""
+        if not self._backend_ready:
+            self._initialize_backend()
+        return self._backend
+    
+    @backend.setter
+    def backend(self, value: Optional[NotificationBackend]) -> None:
+        self._backend = value
+        self._backend_ready = True
+        self._availability = None
+    
+    @property
+    def icon_manager(self) -> Optional[IconSetManager]:
+        """Icon set manager, initialized on first access."""
+        if not self._icon_manager_ready:
+            self._initialize_icon_manager()
+        return self._icon_manager
+    
+    @icon_manager.setter
+    def icon_manager(self, value: Optional[IconSetManager]) -> None:
+        self._icon_manager = value
+        self._icon_manager_ready = True
     
     def _initialize_backend(self) -> None:
         """Initialize the notification backend."""
@@ -93,7 +240,7 @@ class NotificationManager:
                 raise BackendError("No notification backends available")
                 
         except Exception as e:
-            self.logger.error(f"Failed to initialize backend: {e}")
+            self.logger.error("Failed to initialize backend: %s", e)
             self.backend = None
     
     def _initialize_icon_manager(self) -> None:
@@ -103,7 +250,7 @@ class NotificationManager:
                 preferred_icon_set=self.preferred_icon_set
             )
         except Exception as e:
-            self.logger.error(f"Failed to initialize icon manager: {e}")
+            self.logger.error("Failed to initialize icon manager: %s", e)
             self.icon_manager = None
     
     def send(
@@ -123,7 +270,37 @@ class NotificationManager:
         
         For detailed information including icon resolution details,
         use send_detailed() or get_last_notification_result().
+        
+        With background delivery enabled, notifications without actions are
+        queued and True is returned immediately; notifications with actions
+        are sent once the queue has drained, since the caller needs the
+        selected action.
         """
+        if self.background:
+            if not actions:
+                self._enqueue(dict(
+                    icon=icon,
+                    title=title,
+                    message=message,
+                    notification_id=notification_id,
+                    urgency=urgency,
+                    timeout=timeout,
+                    **kwargs
+                ))
+                return True
+            # Keep delivery order: queued notifications go out first
+            self.flush()
+        
+        if not actions and not self._track_last_result:
+            return self._send_fast(
+                icon, title, message,
+                notification_id=notification_id,
+                urgency=urgency,
+                timeout=timeout,
+                action_callback=action_callback,
+                **kwargs
+            )
+        
         result = self.send_detailed(
             icon=icon,
             title=title,
@@ -142,6 +319,87 @@ class NotificationManager:
         else:
             return result.success
     
+    def _send_fast(
+        self,
+        icon: str,
+        title: str,
+        message: str,
+        notification_id: Optional[str] = None,
+        urgency: Optional[str] = None,
+        timeout: Optional[int] = None,
+        **kwargs
+    ) -> bool:
+        """Send a notification without actions, skipping the NotificationResult bookkeeping."""
+        backend = self.backend
+        if not backend:
+            self.logger.error("No notification backend available")
+            return False
+        
+        try:
+            sent = bool(backend.send_notification(
+                icon=self._resolve_icon_detailed(icon).resolved_path or icon,
+                title=title,
+                message=message,
+                notification_id=notification_id,
+                urgency=urgency or self.default_urgency,
+                timeout=timeout if timeout is not None else self.default_timeout,
+                **kwargs
+            ))
+        except Exception as e:
+            self.logger.error("Error sending notification: %s", e)
+            return False
+        
+        if sent:
+            self.logger.debug("Sent notification: %s", title)
+        else:
+            self.logger.warning("Failed to send notification: %s", title)
+        return sent
+    
+    def send_async(
+        self,
+        icon: str,
+        title: str,
+        message: str,
+        notification_id: Optional[str] = None,
+        urgency: Optional[str] = None,
+        timeout: Optional[int] = None,
+        actions: Optional[Dict[str, str]] = None,
+        action_callback: Optional[Callable[[str], None]] = None,
+        **kwargs
+    ) -> "Future[bool]":
+        """
+        Queue a notification for the sender thread and return immediately.
+        
+        The returned Future resolves to what send() would have returned
+        (True/False). Critical notifications are moved ahead of anything
+        else still waiting in the queue, except earlier updates to the same
+        notification_id. Cancelling the Future before it is picked up drops
+        the notification.
+        
+        With coalesce_window_ms configured, updates to the same
+        notification_id arriving within the window are sent once, as the
+        latest update; every Future involved gets that send's outcome.
+        
+        Raises:
+            ValueError: If actions are given. Waiting for the user would hold
+                        up the sender thread; use send() for those.
+        """
+        if actions:
+            raise ValueError("send_async() does not support actions; use send()")
+        
+        future: "Future[bool]" = Future()
+        self._enqueue(dict(
+            icon=icon,
+            title=title,
+            message=message,
+            notification_id=notification_id,
+            urgency=urgency,
+            timeout=timeout,
+            action_callback=action_callback,
+            **kwargs
+        ), future)
+        return future
+    
     def send_detailed(
         self,
         icon: str,
@@ -161,27 +419,26 @@ class NotificationManager:
             NotificationResult with complete details about the notification
             and icon resolution process.
         """
-        total_start_time = time.time()
-        
-        # Initialize result object
-        result = NotificationResult(
-            success=False,
-            backend_used=self.backend.name if self.backend else None,
-            notification_id=notification_id
-        )
+        timed = self._collect_timings
+        total_start = time.perf_counter_ns() if timed else 0
+        backend = self.backend
         
-        if not self.backend:
-            result.error_message = "No notification backend available"
+        if not backend:
+            result = NotificationResult(
+                success=False,
+                notification_id=notification_id,
+                error_message="No notification backend available"
+            )
             self.logger.error(result.error_message)
             self._last_notification_result = result
             return result
         
+        icon_resolution = None
         try:
             # ─────────────────────────────────────────────────────────────────
             # Resolve icon with detailed information
             # ─────────────────────────────────────────────────────────────────
             icon_resolution = self._resolve_icon_detailed(icon)
-            result.icon_resolution = icon_resolution
             
             # ─────────────────────────────────────────────────────────────────
             # Use defaults for unspecified parameters
@@ -192,9 +449,9 @@ class NotificationManager:
             # ─────────────────────────────────────────────────────────────────
             # Send notification via backend
             # ─────────────────────────────────────────────────────────────────
-            send_start_time = time.time()
+            send_start = time.perf_counter_ns() if timed else 0
             
-            backend_result = self.backend.send_notification(
+            backend_result = backend.send_notification(
                 icon=icon_resolution.resolved_path or icon,
                 title=title,
                 message=message,
@@ -206,76 +463,357 @@ class NotificationManager:
                 **kwargs
             )
             
-            result.send_time_ms = (time.time() - send_start_time) * 1000
-            result.total_time_ms = (time.time() - total_start_time) * 1000
+            send_time_ms = total_time_ms = None
+            if timed:
+                end = time.perf_counter_ns()
+                send_time_ms = (end - send_start) / 1_000_000
+                total_time_ms = (end - total_start) / 1_000_000
             
             if actions:
                 # For interactive notifications
-                result.action_result = backend_result if isinstance(backend_result, str) else None
-                result.success = backend_result is not None
+                action_result = backend_result if isinstance(backend_result, str) else None
+                success = backend_result is not None
                 
-                if result.action_result:
-                    self.logger.debug(f"Action selected for '{title}': {result.action_result}")
+                if action_result:
+                    self.logger.debug("Action selected for '%s': %s", title, action_result)
                 else:
-                    self.logger.debug(f"No action selected for '{title}' (timeout/dismiss)")
+                    self.logger.debug("No action selected for '%s' (timeout/dismiss)", title)
             else:
                 # For regular notifications
-                result.success = bool(backend_result)
+                action_result = None
+                success = bool(backend_result)
                 
-                if result.success:
-                    self.logger.debug(f"Sent notification: {title}")
+                if success:
+                    self.logger.debug("Sent notification: %s", title)
                 else:
-                    self.logger.warning(f"Failed to send notification: {title}")
+                    self.logger.warning("Failed to send notification: %s", title)
             
+            # Built once, fully populated
+            result = NotificationResult(
+                success=success,
+                action_result=action_result,
+                icon_resolution=icon_resolution,
+                backend_used=backend.name,
+                notification_id=notification_id,
+                send_time_ms=send_time_ms,
+                total_time_ms=total_time_ms
+            )
             self._last_notification_result = result
             return result
             
         except Exception as e:
-            error_msg = f"Error sending notification: {e}"
-            result.error_message = error_msg
-            result.total_time_ms = (time.time() - total_start_time) * 1000
-            self.logger.error(error_msg)
+            result = NotificationResult(
+                success=False,
+                icon_resolution=icon_resolution,
+                backend_used=backend.name,
+                notification_id=notification_id,
+                total_time_ms=(time.perf_counter_ns() - total_start) / 1_000_000 if timed else None,
+                error_message=f"Error sending notification: {e}"
+            )
+            self.logger.error(result.error_message)
             self._last_notification_result = result
             return result
     
-    def _resolve_icon(self, icon: str) -> str:
+    def _enqueue(self, notification: Dict[str, Any], future: Optional[Future] = None) -> None:
+        """Queue a notification (without actions) for the sender thread."""
+        notification_id = notification.get("notification_id")
+        if self._coalesce_window and notification_id:
+            # ─────────────────────────────────────────────────────────────────
+            # Hold updates to this notification for one window and send only
+            # the latest (the window starts at the first held update, so a
+            # steady stream still goes out once per window)
+            # ─────────────────────────────────────────────────────────────────
+            with self._pending_lock:
+                pending = self._pending.get(notification_id)
+                if pending is None:
+                    timer = threading.Timer(
+                        self._coalesce_window, self._release_pending, args=(notification_id,)
+                    )
+                    timer.daemon = True
+                    pending = self._pending[notification_id] = [notification, [], timer]
+                    timer.start()
+                pending[0] = notification
+                if future is not None:
+                    pending[1].append(future)
+            return
+        
+        self._put_outbox(notification, future)
+    
+    def _release_pending(self, notification_id: str) -> None:
+        """Queue the latest update held back for notification_id."""
+        with self._pending_lock:
+            pending = self._pending.pop(notification_id, None)
+        if pending is None:
+            return
+        
+        notification, waiting, timer = pending
+        timer.cancel()
+        
+        future = None
+        if waiting:
+            future = Future()
+            future.add_done_callback(functools.partial(_settle_waiting, waiting))
+        self._put_outbox(notification, future)
+    
+    def _put_outbox(self, notification: Dict[str, Any], future: Optional[Future]) -> None:
+        """Put a notification on the sender queue, starting the sender thread if needed."""
+        # Critical first, otherwise first in first out
+        urgency = notification.get("urgency") or self.default_urgency
+        priority = 0 if urgency == "critical" else 1
+        notification_id = notification.get("notification_id")
+        
+        with self._outbox_lock:
+            if self._outbox is None:
+                self._outbox = queue.PriorityQueue()
+                self._sender = threading.Thread(
+                    target=self._deliver_queued,
+                    args=(self._outbox,),
+                    name="desktop-notify-sender",
+                    daemon=True
+                )
+                self._sender.start()
+                # Deliver whatever is still queued when the program exits,
+                # without hanging the exit on a stuck backend
+                atexit.register(self.flush, EXIT_FLUSH_TIMEOUT)
+            
+            position = self._queued_ids.get(notification_id) if notification_id else None
+            if position is not None:
+                # An update must not overtake the one already queued for the
+                # same notification: slot it in right behind that one
+                priority, seq, sub = position
+                position = (priority, seq, sub + 1)
+            else:
+                position = (priority, next(self._outbox_seq), 0)
+            if notification_id:
+                self._queued_ids[notification_id] = position
+            self._outbox.put((*position, notification, future))
+    
+    def _deliver_queued(self, outbox: queue.PriorityQueue) -> None:
+        """Sender thread: hand queued notifications to the backend in order until close()."""
+        while True:
+            batch = [outbox.get()]
+            
+            # Whatever queued up while the previous batch was being sent goes
+            # out together, so batches grow with the burst rate and a lone
+            # notification is never held back
+            try:
+                while len(batch) < MAX_SEND_BATCH:
+                    batch.append(outbox.get_nowait())
+            except queue.Empty:
+                pass
+            
+            self._forget_queued(batch)
+            
+            stopping = False
+            try:
+                run: List[Tuple[Dict[str, Any], Optional[Future]]] = []
+                for _, _, _, notification, future in batch:
+                    if notification is None:
+                        stopping = True  # close() sentinel, always last
+                        continue
+                    if future is not None and not future.set_running_or_notify_cancel():
+                        continue  # cancelled while queued
+                    run.append((notification, future))
+                self._deliver_run(run)
+            finally:
+                for _ in batch:
+                    outbox.task_done()
+            if stopping:
+                return
+    
+    def _forget_queued(self, batch: List[tuple]) -> None:
+        """Drop the queue positions of notifications the sender has taken off the queue."""
+        with self._outbox_lock:
+            for *position, notification, _ in batch:
+                notification_id = notification and notification.get("notification_id")
+                if notification_id and self._queued_ids.get(notification_id) == tuple(position):
+                    del self._queued_ids[notification_id]
+    
+    def _deliver_run(self, run: List[Tuple[Dict[str, Any], Optional[Future]]]) -> None:
+        """Send queued notifications and settle their futures."""
+        if not run:
+            return
+        
+        try:
+            if len(run) == 1:
+                outcomes = [self.send_detailed(**run[0][0]).success]
+            else:
+                outcomes = [result.success for result in self._send_batch([notification for notification, _ in run])]
+        except Exception as e:
+            self.logger.error("Background delivery failed: %s", e)
+            for _, future in run:
+                if future is not None:
+                    future.set_exception(e)
+            return
+        
+        for (_, future), outcome in zip(run, outcomes, strict=True):
+            if future is not None:
+                future.set_result(outcome)
+    
+    def _send_batch(self, batch: List[Dict[str, Any]]) -> List[NotificationResult]:
+        """Resolve icons and defaults for notifications without actions and send them in one backend call."""
+        timed = self._collect_timings
+        total_start = time.perf_counter_ns() if timed else 0
+        backend = self.backend
+        
+        if not backend:
+            error_message = "No notification backend available"
+            self.logger.error(error_message)
+            results = [
+                NotificationResult(
+                    success=False,
+                    notification_id=notification.get("notification_id"),
+                    error_message=error_message
+                )
+                for notification in batch
+            ]
+            self._last_notification_result = results[-1]
+            return results
+        
+        # ─────────────────────────────────────────────────────────────────
+        # Resolve every icon first, then hand the whole batch over
+        # ─────────────────────────────────────────────────────────────────
+        resolutions = []
+        requests = []
+        for notification in batch:
+            icon_resolution = self._resolve_icon_detailed(notification["icon"])
+            resolutions.append(icon_resolution)
+            requests.append(dict(
+                notification,
+                icon=icon_resolution.resolved_path or notification["icon"],
+                urgency=notification.get("urgency") or self.default_urgency,
+                timeout=notification["timeout"] if notification.get("timeout") is not None else self.default_timeout
+            ))
+        
+        send_start = time.perf_counter_ns() if timed else 0
+        error_message = None
+        try:
+            outcomes = backend.send_notifications(requests)
+        except Exception as e:
+            error_message = f"Error sending notifications: {e}"
+            self.logger.error(error_message)
+            outcomes = [False] * len(requests)
+        
+        send_time_ms = total_time_ms = None
+        if timed:
+            end = time.perf_counter_ns()
+            send_time_ms = (end - send_start) / 1_000_000
+            total_time_ms = (end - total_start) / 1_000_000
+        
+        # Timings cover the whole batch
+        results = []
+        for notification, icon_resolution, outcome in zip(batch, resolutions, outcomes, strict=True):
+            success = bool(outcome)
+            if success:
+                self.logger.debug("Sent notification: %s", notification['title'])
+            else:
+                self.logger.warning("Failed to send notification: %s", notification['title'])
+            results.append(NotificationResult(
+                success=success,
+                icon_resolution=icon_resolution,
+                backend_used=backend.name,
+                notification_id=notification.get("notification_id"),
+                send_time_ms=send_time_ms,
+                total_time_ms=total_time_ms,
+                error_message=error_message
+            ))
+        
+        self._last_notification_result = results[-1]
+        return results
+    
+    def send_many(self, notifications: List[Dict[str, Any]]) -> List[NotificationResult]:
         """
-        Resolve icon name to path/glyph using icon manager.
+        Send several notifications, handing those without actions to the
+        backend together.
+        
+        Icons for the whole group are resolved first and the backend gets
+        them in one send_notifications() call (pipelined over a single
+        D-Bus connection for dunst). Notifications with actions wait for
+        the user, so each is sent on its own, in order.
         
         Args:
-            icon: Icon name to resolve
+            notifications: Keyword-argument dicts for send() (icon, title,
+                           message and any optional parameters)
             
         Returns:
-            Resolved icon path/glyph or fallback
+            One NotificationResult per notification, in order
         """
-        if not self.icon_manager:
-            self.logger.debug(f"📎 No icon manager available, using '{icon}' as-is")
-            return icon  # Return as-is if no icon manager
+        if self.background:
+            # Keep delivery order: queued notifications go out first
+            self.flush()
         
-        try:
-            # Check if we should log resolution
-            should_log = self._should_log_resolution()
-            
-            if should_log:
-                active_set = self.icon_manager.get_active_icon_set()
-                self.logger.info(f"🎨 Resolving icon '{icon}' using set: {active_set}")
-            
-            resolved = self.icon_manager.get_icon(icon, fallback=True)
-            
-            if resolved and resolved != icon:
-                if should_log:
-                    self.logger.info(f"🎯 Final resolution: '{icon}' → '{resolved}'")
-                else:
-                    self.logger.debug(f"Icon resolved: '{icon}' -> '{resolved}'")
-                return resolved
+        results: List[NotificationResult] = []
+        run: List[Dict[str, Any]] = []
+        for notification in notifications:
+            if notification.get("actions"):
+                if run:
+                    results.extend(self._send_batch(run))
+                    run = []
+                results.append(self.send_detailed(**notification))
             else:
-                if should_log:
-                    self.logger.info(f"📎 Using original icon name: '{icon}'")
-                return icon
-                
-        except Exception as e:
-            self.logger.error(f"Icon resolution failed for '{icon}': {e}")
-            return icon
+                run.append(notification)
+        if run:
+            results.extend(self._send_batch(run))
+        
+        return results
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued notification has been handed to the backend.
+        
+        Called on the sender thread itself it only releases held updates:
+        waiting there would wait on the item that thread is still delivering.
+        
+        Args:
+            timeout: Longest wait in seconds (None waits as long as it takes)
+            
+        Returns:
+            True if the queue drained, False if the timeout ran out first
+        """
+        with self._pending_lock:
+            held = list(self._pending)
+        for notification_id in held:
+            self._release_pending(notification_id)
+        
+        outbox = self._outbox
+        if outbox is None or threading.current_thread() is self._sender:
+            return True
+        with outbox.all_tasks_done:
+            return outbox.all_tasks_done.wait_for(lambda: not outbox.unfinished_tasks, timeout)
+    
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Deliver what is queued, then stop the sender thread.
+        
+        The exit-time flush is unregistered. Sending in the background again
+        afterwards starts a new sender thread.
+        
+        Args:
+            timeout: Longest wait in seconds for the sender thread to finish
+        """
+        with self._pending_lock:
+            held = list(self._pending)
+        for notification_id in held:
+            self._release_pending(notification_id)
+        
+        with self._outbox_lock:
+            outbox, sender = self._outbox, self._sender
+            if outbox is None:
+                return
+            self._outbox = self._sender = None
+            self._queued_ids.clear()
+            # Sorts after every notification, so the queue drains first
+            outbox.put((2, next(self._outbox_seq), 0, None, None))
+        
+        atexit.unregister(self.flush)
+        if sender is not threading.current_thread():
+            sender.join(timeout)
+    
+    def __enter__(self) -> "NotificationManager":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def _resolve_icon_detailed(self, icon: str) -> IconResolutionInfo:
         """
@@ -286,33 +824,90 @@ class NotificationManager:
             
         Returns:
             IconResolutionInfo with complete resolution details
+            (resolved_path is what backends are given)
         """
+        # Existing files need no icon set lookup
+        is_file = icon.startswith(FILE_ICON_PREFIXES)
+        info = self._resolve_file_icon(icon) if is_file else None
+        if info is not None:
+            self._last_resolved_icon = info
+            return info
+        
         if not self.icon_manager:
-            # Create basic resolution info for missing icon manager
-            from .types import IconResolutionSource
-            return IconResolutionInfo(
+            self.logger.debug("📎 No icon manager available, using '%s' as-is", icon)
+            info = IconResolutionInfo(
                 original_name=icon,
                 resolved_path=icon,
                 source=IconResolutionSource.NOT_FOUND
             )
+            self._last_resolved_icon = info
+            return info
         
         try:
-            return self.icon_manager.get_icon_detailed(icon, fallback=True)
+            # ─────────────────────────────────────────────────────────────────
+            # Reuse earlier resolutions made with the same active icon set
+            # (file icons are always re-checked, the file may come or go).
+            # Repeats share one IconResolutionInfo marked cached=True, so
+            # results for the same icon hold the same (read-only) object
+            # ─────────────────────────────────────────────────────────────────
+            active_set = self.icon_manager.get_active_icon_set()
+            cache_key = (active_set, icon)
+            info = self._icon_cache.get(cache_key)
+            
+            if info is None:
+                # Check if we should log resolution
+                should_log = self._log_icon_resolution and self.logger.isEnabledFor(logging.INFO)
+                
+                if should_log:
+                    self.logger.info("🎨 Resolving icon '%s' using set: %s", icon, active_set)
+                
+                info = self._lookup_icon(active_set, icon, is_file)
+                
+                resolved = info.resolved_path
+                if resolved and resolved != icon:
+                    if should_log:
+                        self.logger.info("🎯 Final resolution: '%s' → '%s'", icon, resolved)
+                    else:
+                        self.logger.debug("Icon resolved: '%s' -> '%s'", icon, resolved)
+                elif should_log:
+                    self.logger.info("📎 Using original icon name: '%s'", icon)
+                
+                if not is_file:
+                    self._icon_cache[cache_key] = info if info.cached else dataclasses.replace(info, cached=True)
+            
+            self._last_resolved_icon = info
+            return info
+            
         except Exception as e:
-            self.logger.error(f"Icon resolution failed for '{icon}': {e}")
-            from .types import IconResolutionSource
-            return IconResolutionInfo(
+            self.logger.error("Icon resolution failed for '%s': %s", icon, e)
+            info = IconResolutionInfo(
                 original_name=icon,
                 resolved_path=icon,
                 source=IconResolutionSource.NOT_FOUND
             )
+            self._last_resolved_icon = info
+            return info
     
-    def _should_log_resolution(self) -> bool:
-        """Check if icon resolution should be logged based on config."""
-        try:
-            return self.config.log_icon_resolution
-        except:
-            return False
+    def _resolve_file_icon(self, icon: str) -> Optional[IconResolutionInfo]:
+        """Resolution for an icon given as a path or file:// URI, or None if no such file exists."""
+        path = os.path.expanduser(icon[7:] if icon.startswith("file://") else icon)
+        if not os.path.isfile(path):
+            return None
+        return IconResolutionInfo(
+            original_name=icon,
+            resolved_path=path,
+            source=IconResolutionSource.FILE_PATH
+        )
+    
+    def _lookup_icon(self, active_set: Optional[str], icon: str, is_file: bool) -> IconResolutionInfo:
+        """Resolve an icon through the on-disk cache (if enabled) or the icon manager."""
+        persistent = self._persistent_icons
+        info = persistent.get(active_set, icon) if persistent else None
+        if info is None:
+            info = self.icon_manager.get_icon_detailed(icon, fallback=True)
+            if persistent and not is_file:
+                persistent.put(active_set, info)
+        return info
     
     def is_available(self) -> bool:
         """
@@ -321,7 +916,21 @@ class NotificationManager:
         Returns:
             True if notifications can be sent
         """
-        return self.backend is not None and self.backend.is_available()
+        if not self._backend_ready:
+            # Discovery only lists backends that are available, so there is
+            # no need to select (and log) one just to answer this
+            return bool(self.backend_discovery.discover_available_backends())
+        
+        # ─────────────────────────────────────────────────────────────────
+        # Backends may probe the daemon here; reuse a recent answer
+        # ─────────────────────────────────────────────────────────────────
+        now = time.monotonic()
+        if self._availability is not None and now - self._availability[0] < AVAILABILITY_TTL:
+            return self._availability[1]
+        
+        available = self._backend is not None and self._backend.is_available()
+        self._availability = (now, available)
+        return available
     
     def get_backend_info(self) -> Optional[Dict[str, Any]]:
         """
@@ -334,12 +943,12 @@ class NotificationManager:
             return self.backend.get_backend_info()
         return None
     
-    def list_available_backends(self) -> List[str]:
+    def list_available_backends(self) -> Tuple[str, ...]:
         """
         List available notification backends.
         
         Returns:
-            List of backend names
+            Backend names, best first (cached by the shared discovery)
         """
         return self.backend_discovery.discover_available_backends()
     
@@ -357,21 +966,21 @@ class NotificationManager:
             new_backend = self.backend_discovery.get_backend(backend_name)
             
             if not new_backend:
-                self.logger.error(f"Backend '{backend_name}' not available")
+                self.logger.error("Backend '%s' not available", backend_name)
                 return False
             
             if not new_backend.is_available():
-                self.logger.error(f"Backend '{backend_name}' is not available")
+                self.logger.error("Backend '%s' is not available", backend_name)
                 return False
             
             self.backend = new_backend
             self.preferred_backend = backend_name
             
-            self.logger.info(f"Switched to backend: {backend_name}")
+            self.logger.info("Switched to backend: %s", backend_name)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to switch backend: {e}")
+            self.logger.error("Failed to switch backend: %s", e)
             return False
     
     def switch_icon_set(self, icon_set_name: str) -> bool:
@@ -387,18 +996,24 @@ class NotificationManager:
         if not self.icon_manager:
             return False
         
-        return self.icon_manager.set_active_icon_set(icon_set_name)
+        switched = self.icon_manager.set_active_icon_set(icon_set_name)
+        if switched:
+            self._icon_cache.clear()
+            self._icon_sets = None
+        return switched
     
-    def list_available_icon_sets(self) -> List[str]:
+    def list_available_icon_sets(self) -> Tuple[str, ...]:
         """
         List available icon sets.
         
         Returns:
-            List of icon set names
+            Icon set names (probed once, refreshed after switch_icon_set)
         """
-        if self.icon_manager:
-            return self.icon_manager.list_available_sets()
-        return []
+        if self._icon_sets is None:
+            if not self.icon_manager:
+                return ()
+            self._icon_sets = tuple(self.icon_manager.list_available_sets())
+        return self._icon_sets
     
     def get_last_notification_result(self) -> Optional[NotificationResult]:
         """
@@ -416,6 +1031,8 @@ class NotificationManager:
         Returns:
             IconResolutionInfo for the last resolved icon, or None if no resolution yet
         """
+        if self._last_resolved_icon is not None:
+            return self._last_resolved_icon
         if self.icon_manager:
             return self.icon_manager.get_last_resolved_icon()
         return None
@@ -440,22 +1057,35 @@ class NotificationManager:
 # Global notification manager instance
 # ═══════════════════════════════════════════════════════════════════════════════
 _global_manager: Optional[NotificationManager] = None
+_global_manager_settings: Dict[str, Any] = {}
+_global_manager_lock = threading.Lock()
 
 
 def get_notification_manager(**kwargs) -> NotificationManager:
     """
     Get the global notification manager instance.
     
+    The first call creates it with the given settings; later calls return
+    the same manager, so configure it once at startup. A later call with
+    different settings logs a warning, since they are not applied.
+    
     Args:
         **kwargs: Configuration overrides for manager initialization
         
     Returns:
         NotificationManager instance
     """
-    global _global_manager
+    global _global_manager, _global_manager_settings
     
-    if _global_manager is None:
-        _global_manager = NotificationManager(**kwargs)
+    with _global_manager_lock:
+        if _global_manager is None:
+            _global_manager = NotificationManager(**kwargs)
+            _global_manager_settings = kwargs
+        elif kwargs and kwargs != _global_manager_settings:
+            _LOG.warning(
+                "Notification manager already created with %s; ignoring %s",
+                _global_manager_settings or "defaults", kwargs
+            )
     
     return _global_manager
 
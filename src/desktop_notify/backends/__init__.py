@@ -5,16 +5,38 @@
 backends
 
 Pluggable notification backend system supporting multiple notification daemons.
+
+Backend modules are imported on first attribute access, so importing the
+package does not pull in every backend (and its dependencies).
 """
 
-from .base import NotificationBackend
-from .dunst import DunstBackend
-from .console import ConsoleBackend
-from .discovery import BackendDiscovery
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "NotificationBackend": ".base",
+    "DunstBackend": ".dunst",
+    "ConsoleBackend": ".console",
+    "BackendDiscovery": ".discovery",
+    "get_backend_discovery": ".discovery",
+}
 
 __all__ = [
     "NotificationBackend",
     "DunstBackend", 
     "ConsoleBackend",
     "BackendDiscovery",
-]
\ No newline at end of file
+    "get_backend_discovery",
+]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
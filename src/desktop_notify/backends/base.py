@@ -11,7 +11,28 @@ Abstract base class for notification backend implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Callable, Union
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Optional, Callable, Union
+
+
+# Accepted urgency spellings (lowercase) -> urgency level
+URGENCY_LEVELS: Dict[str, str] = {
+    'low': 'low',
+    'normal': 'normal',
+    'critical': 'critical',
+    
+    # Common alternatives
+    'info': 'normal',
+    'information': 'normal',
+    'warn': 'normal',
+    'warning': 'normal',
+    'error': 'critical',
+    'high': 'critical',
+    'urgent': 'critical',
+}
+
+# Longest timeout backends are asked for (milliseconds)
+MAX_TIMEOUT = 60000
 
 
 class NotificationBackend(ABC):
@@ -70,6 +91,22 @@ class NotificationBackend(ABC):
         """
         pass
     
+    def send_notifications(self, notifications: List[Dict[str, Any]]) -> List[Union[bool, str]]:
+        """
+        Send several notifications in one go.
+        
+        Backends that can hand a group of notifications to the daemon more
+        cheaply than one at a time override this; the default sends them
+        in order.
+        
+        Args:
+            notifications: Keyword-argument dicts for send_notification()
+            
+        Returns:
+            One send_notification() result per notification, in order
+        """
+        return [self.send_notification(**notification) for notification in notifications]
+    
     @abstractmethod
     def is_available(self) -> bool:
         """
@@ -90,6 +127,11 @@ class NotificationBackend(ABC):
         """
         pass
     
+    @cached_property
+    def _feature_set(self) -> FrozenSet[str]:
+        """Features listed in get_backend_info(), collected on first use."""
+        return frozenset(self.get_backend_info().get('features', ()))
+    
     def supports_feature(self, feature: str) -> bool:
         """
         Check if backend supports a specific feature.
@@ -101,9 +143,7 @@ class NotificationBackend(ABC):
         Returns:
             True if feature is supported, False otherwise
         """
-        info = self.get_backend_info()
-        features = info.get('features', [])
-        return feature in features
+        return feature in self._feature_set
     
     def validate_urgency(self, urgency: str) -> str:
         """
@@ -115,24 +155,7 @@ class NotificationBackend(ABC):
         Returns:
             Normalized urgency level
         """
-        valid_urgencies = ['low', 'normal', 'critical']
-        urgency_lower = urgency.lower()
-        
-        if urgency_lower in valid_urgencies:
-            return urgency_lower
-        
-        # Map common alternatives
-        urgency_map = {
-            'info': 'normal',
-            'information': 'normal',
-            'warn': 'normal', 
-            'warning': 'normal',
-            'error': 'critical',
-            'high': 'critical',
-            'urgent': 'critical',
-        }
-        
-        return urgency_map.get(urgency_lower, 'normal')
+        return URGENCY_LEVELS.get(urgency.lower(), 'normal')
     
     def validate_timeout(self, timeout: Optional[int]) -> Optional[int]:
         """
@@ -147,13 +170,9 @@ class NotificationBackend(ABC):
         if timeout is None:
             return None
         
-        # Ensure non-negative
+        # Ensure non-negative; some backends have limits
         if timeout < 0:
             return 0
-            
-        # Some backends have limits
-        max_timeout = 60000  # 60 seconds
-        if timeout > max_timeout:
-            return max_timeout
-            
+        if timeout > MAX_TIMEOUT:
+            return MAX_TIMEOUT
         return timeout
\ No newline at end of file
@@ -12,12 +12,69 @@ Console notification backend for headless environments and fallback.
 
 import logging
 import sys
-from datetime import datetime
-from typing import Any, Dict, Optional, Callable, Union
+from time import localtime, strftime
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Callable, Union
 
 from .base import NotificationBackend
 
 
+# ANSI escape codes by color name, and the same names mapped to '' for
+# plain output; shared by every ConsoleBackend
+ANSI_COLORS: Mapping[str, str] = MappingProxyType({
+    'reset':     '\033[0m',
+    'bold':      '\033[1m',
+    'dim':       '\033[2m',
+    'red':       '\033[31m',
+    'green':     '\033[32m',
+    'yellow':    '\033[33m',
+    'blue':      '\033[34m',
+    'magenta':   '\033[35m',
+    'cyan':      '\033[36m',
+    'white':     '\033[37m',
+})
+NO_COLORS: Mapping[str, str] = MappingProxyType(dict.fromkeys(ANSI_COLORS, ''))
+
+# Longest rule drawn under a notification (cut to the message length)
+SEPARATOR_LINE = "─" * 50
+
+# Common icon names -> unicode/text shown in the console
+CONSOLE_ICON_MAP: Dict[str, str] = {
+    # Status icons
+    "info":        "ℹ️",
+    "warning":     "⚠️",
+    "error":       "❌",
+    "success":     "✅",
+    "question":    "❓",
+    
+    # Action icons
+    "save":        "💾",
+    "load":        "📥", 
+    "open":        "📂",
+    "close":       "❌",
+    "edit":        "✏️",
+    "delete":      "🗑️",
+    
+    # Device icons
+    "mic":         "🎤",
+    "camera":      "📷",
+    "speaker":     "🔊",
+    "headphones":  "🎧",
+    
+    # System icons
+    "settings":    "⚙️",
+    "user":        "👤",
+    "lock":        "🔒",
+    "unlock":      "🔓",
+    
+    # Fallback
+    "notification": "🔔",
+}
+
+# Shown for icons not in CONSOLE_ICON_MAP
+DEFAULT_CONSOLE_ICON = "📢"
+
+
 class ConsoleBackend(NotificationBackend):
     """
     ///////////////////////////////////////////////////////////////////
@@ -37,37 +94,22 @@ class ConsoleBackend(NotificationBackend):
             use_colors: Whether to use ANSI colors in output
             timestamp: Whether to include timestamps
         """
-        self.use_colors = use_colors
         self.timestamp = timestamp
         self.logger = logging.getLogger(__name__)
         
-        # ─────────────────────────────────────────────────────────────────
-        # Color definitions
-        # ─────────────────────────────────────────────────────────────────
-        self.colors = {
-            'reset':     '\033[0m',
-            'bold':      '\033[1m',
-            'dim':       '\033[2m',
-            'red':       '\033[31m',
-            'green':     '\033[32m',
-            'yellow':    '\033[33m',
-            'blue':      '\033[34m',
-            'magenta':   '\033[35m',
-            'cyan':      '\033[36m',
-            'white':     '\033[37m',
-        } if use_colors else {k: '' for k in [
-            'reset', 'bold', 'dim', 'red', 'green', 
-            'yellow', 'blue', 'magenta', 'cyan', 'white'
-        ]}
-        
-        # ─────────────────────────────────────────────────────────────────
-        # Urgency to color mapping
-        # ─────────────────────────────────────────────────────────────────
-        self.urgency_colors = {
-            'low':      self.colors['dim'],
-            'normal':   self.colors['blue'],
-            'critical': self.colors['red'] + self.colors['bold'],
+        self.set_colors_enabled(use_colors)
+    
+    def _rebuild_urgency_prefix(self) -> None:
+        """Precompute the colored urgency indicators and the header template."""
+        self._urgency_prefix = {
+            urgency: f"{self.urgency_colors[urgency]}{self._get_urgency_indicator(urgency)} "
+            for urgency in ('low', 'normal', 'critical')
         }
+        self._header_fmt = (
+            "{timestamp}{urgency}{icon} "
+            + self.colors['bold'] + "{title}" + self.colors['reset']
+            + "{notification_id}"
+        )
     
     @property
     def name(self) -> str:
@@ -100,15 +142,11 @@ class ConsoleBackend(NotificationBackend):
             # ─────────────────────────────────────────────────────────────────
             # Format notification components
             # ─────────────────────────────────────────────────────────────────
-            timestamp_str = ""
-            if self.timestamp:
-                now = datetime.now()
-                timestamp_str = f"[{now.strftime('%H:%M:%S')}] "
+            timestamp_str = f"[{strftime('%H:%M:%S', localtime())}] " if self.timestamp else ""
             
             # Format urgency indicator
             validated_urgency = self.validate_urgency(urgency)
-            urgency_color = self.urgency_colors.get(validated_urgency, '')
-            urgency_indicator = self._get_urgency_indicator(validated_urgency)
+            urgency_prefix = self._urgency_prefix.get(validated_urgency, self._urgency_prefix['normal'])
             
             # Format icon (convert to text representation)
             icon_str = self._format_icon(icon)
@@ -119,45 +157,41 @@ class ConsoleBackend(NotificationBackend):
             # ─────────────────────────────────────────────────────────────────
             # Build notification output
             # ─────────────────────────────────────────────────────────────────
-            header = (
-                f"{timestamp_str}"
-                f"{urgency_color}{urgency_indicator} "
-                f"{icon_str} "
-                f"{self.colors['bold']}{title}{self.colors['reset']}"
-                f"{id_str}"
+            header = self._header_fmt.format(
+                timestamp=timestamp_str,
+                urgency=urgency_prefix,
+                icon=icon_str,
+                title=title,
+                notification_id=id_str
             )
             
-            body = f"    {message}"
-            
             # Add separator line for better visibility
-            separator = "    " + "─" * min(50, len(message))
+            separator = "    " + SEPARATOR_LINE[:len(message)]
             
             # ─────────────────────────────────────────────────────────────────
             # Add actions if provided (console doesn't support interactive actions)
             # ─────────────────────────────────────────────────────────────────
-            action_lines = []
+            action_text = ""
             if actions:
-                action_lines.append("    Available actions:")
-                for action_id, label in actions.items():
-                    action_lines.append(f"      - {label} ({action_id})")
-                action_lines.append("    Note: Console backend does not support interactive actions")
+                action_text = (
+                    "    Available actions:\n"
+                    + "".join(f"      - {label} ({action_id})\n" for action_id, label in actions.items())
+                    + "    Note: Console backend does not support interactive actions\n"
+                )
             
             # ─────────────────────────────────────────────────────────────────
-            # Output to stderr (to not interfere with script output)
+            # Output to stderr (to not interfere with script output), in one
+            # write and flushed immediately
             # ─────────────────────────────────────────────────────────────────
-            output_lines = [header, body] + action_lines + [separator]
-            
-            for line in output_lines:
-                print(line, file=sys.stderr)
-            
-            # Flush to ensure immediate output
+            sys.stderr.write(f"{header}\n    {message}\n{action_text}{separator}\n")
             sys.stderr.flush()
             
-            self.logger.debug(f"Sent console notification: {title}")
+            self.logger.debug("Sent console notification: %s", title)
             
             # Console backend doesn't support interactive actions
             if actions:
-                self.logger.debug(f"Console backend cannot handle actions: {list(actions.keys())}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Console backend cannot handle actions: %s", list(actions))
                 return None  # No action can be selected
             else:
                 return True
@@ -186,43 +220,10 @@ class ConsoleBackend(NotificationBackend):
             Formatted icon string
         """
         # If it's already a unicode character/emoji, use as-is
-        if len(icon) <= 4 and any(ord(c) > 127 for c in icon):
+        if len(icon) <= 4 and not icon.isascii():
             return icon
         
-        # Convert common icon names to unicode/text
-        icon_map = {
-            # Status icons
-            "info":        "ℹ️",
-            "warning":     "⚠️",
-            "error":       "❌",
-            "success":     "✅",
-            "question":    "❓",
-            
-            # Action icons
-            "save":        "💾",
-            "load":        "📥", 
-            "open":        "📂",
-            "close":       "❌",
-            "edit":        "✏️",
-            "delete":      "🗑️",
-            
-            # Device icons
-            "mic":         "🎤",
-            "camera":      "📷",
-            "speaker":     "🔊",
-            "headphones":  "🎧",
-            
-            # System icons
-            "settings":    "⚙️",
-            "user":        "👤",
-            "lock":        "🔒",
-            "unlock":      "🔓",
-            
-            # Fallback
-            "notification": "🔔",
-        }
-        
-        return icon_map.get(icon, "📢")  # Default notification icon
+        return CONSOLE_ICON_MAP.get(icon, DEFAULT_CONSOLE_ICON)
     
     def is_available(self) -> bool:
         """Check if Console backend is available."""
@@ -270,22 +271,7 @@ class ConsoleBackend(NotificationBackend):
         """
         self.use_colors = enabled
         
-        # Update color definitions
-        if enabled:
-            self.colors = {
-                'reset':     '\033[0m',
-                'bold':      '\033[1m', 
-                'dim':       '\033[2m',
-                'red':       '\033[31m',
-                'green':     '\033[32m',
-                'yellow':    '\033[33m',
-                'blue':      '\033[34m',
-                'magenta':   '\033[35m',
-                'cyan':      '\033[36m',
-                'white':     '\033[37m',
-            }
-        else:
-            self.colors = {k: '' for k in self.colors.keys()}
+        self.colors = ANSI_COLORS if enabled else NO_COLORS
         
         # Update urgency colors
         self.urgency_colors = {
@@ -293,6 +279,7 @@ class ConsoleBackend(NotificationBackend):
             'normal':   self.colors['blue'],
             'critical': self.colors['red'] + self.colors['bold'],
         }
+        self._rebuild_urgency_prefix()
     
     def set_timestamp_enabled(self, enabled: bool) -> None:
         """
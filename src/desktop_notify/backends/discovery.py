@@ -10,12 +10,31 @@ VERSION: 1.0.0
 Automatic backend discovery and selection system.
 """
 
+import importlib
 import logging
-from typing import Dict, List, Optional, Type
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple, Type, Union
 
 from .base import NotificationBackend
-from .dunst import DunstBackend
-from .console import ConsoleBackend
+
+
+# Built-in backends as "module:Class"; each is imported when first needed
+BUILTIN_BACKENDS: Dict[str, str] = {
+    "dunst": ".dunst:DunstBackend",
+    "console": ".console:ConsoleBackend",
+}
+
+
+# Environment variables that decide which backends can work (command lookup
+# and the desktop session); discovery is redone when any of them changes
+DISCOVERY_ENV_VARS = ("PATH", "DISPLAY", "WAYLAND_DISPLAY", "DBUS_SESSION_BUS_ADDRESS")
+
+
+def _environment_fingerprint() -> Tuple[Optional[str], ...]:
+    """Snapshot of the environment that backend availability depends on."""
+    return tuple(os.environ.get(name) for name in DISCOVERY_ENV_VARS)
 
 
 class BackendDiscovery:
@@ -34,18 +53,16 @@ class BackendDiscovery:
         self.logger = logging.getLogger(__name__)
         
         # ─────────────────────────────────────────────────────────────────
-        # Register default backend classes
+        # Register default backends (import paths until first use)
         # ─────────────────────────────────────────────────────────────────
-        self.backend_classes: Dict[str, Type[NotificationBackend]] = {
-            "dunst": DunstBackend,
-            "console": ConsoleBackend,
-        }
+        self.backend_classes: Dict[str, Union[Type[NotificationBackend], str]] = dict(BUILTIN_BACKENDS)
         
         # ─────────────────────────────────────────────────────────────────
         # Cache for initialized backends
         # ─────────────────────────────────────────────────────────────────
         self._backend_cache: Dict[str, NotificationBackend] = {}
-        self._available_backends: Optional[List[str]] = None
+        self._available_backends: Optional[Tuple[str, ...]] = None
+        self._environment: Optional[Tuple[Optional[str], ...]] = None
     
     def register_backend(self, name: str, backend_class: Type[NotificationBackend]) -> None:
         """
@@ -82,25 +99,37 @@ class BackendDiscovery:
         # Initialize backend
         try:
             backend_class = self.backend_classes[name]
+            if isinstance(backend_class, str):
+                module_name, class_name = backend_class.split(":")
+                module = importlib.import_module(module_name, __package__)
+                backend_class = self.backend_classes[name] = getattr(module, class_name)
             backend = backend_class()
             
             # Cache the instance
             self._backend_cache[name] = backend
             
-            self.logger.debug(f"Initialized backend: {name}")
+            self.logger.debug("Initialized backend: %s", name)
             return backend
             
         except Exception as e:
             self.logger.warning(f"Failed to initialize backend '{name}': {e}")
             return None
     
-    def discover_available_backends(self) -> List[str]:
+    def discover_available_backends(self) -> Tuple[str, ...]:
         """
         Discover all available backends on the system.
         
         Returns:
-            List of available backend names
+            Available backend names, best first (cached until the
+            environment changes or a backend is registered)
         """
+        environment = _environment_fingerprint()
+        if environment != self._environment:
+            # Availability was probed under a different session/PATH
+            if self._environment is not None:
+                self.clear_cache()
+            self._environment = environment
+        
         if self._available_backends is not None:
             return self._available_backends
         
@@ -109,18 +138,19 @@ class BackendDiscovery:
         for name in self.backend_classes:
             backend = self.get_backend(name)
             if backend and backend.is_available():
-                available.append(name)
-                self.logger.debug(f"Backend '{name}' is available")
+                available.append((backend.priority, name))
+                self.logger.debug("Backend '%s' is available", name)
             else:
-                self.logger.debug(f"Backend '{name}' is not available")
+                self.logger.debug("Backend '%s' is not available", name)
         
-        # Sort by priority (higher = better)
-        available.sort(key=lambda name: self.get_backend(name).priority, reverse=True)
+        # Sort by priority (higher = better); ties keep registration order
+        available.sort(key=itemgetter(0), reverse=True)
+        available = [name for _, name in available]
         
-        self._available_backends = available
+        self._available_backends = tuple(available)
         self.logger.info(f"Discovered {len(available)} available backends: {available}")
         
-        return available
+        return self._available_backends
     
     def get_best_backend(self, preferred: Optional[str] = None) -> Optional[NotificationBackend]:
         """
@@ -142,13 +172,12 @@ class BackendDiscovery:
         # Use preferred backend if specified and available
         # ─────────────────────────────────────────────────────────────────
         if preferred:
-            if preferred in available_backends:
-                backend = self.get_backend(preferred)
-                if backend:
-                    self.logger.info(f"Using preferred backend: {preferred}")
-                    return backend
-            else:
-                self.logger.warning(f"Preferred backend '{preferred}' not available")
+            # Discovery left every probed backend in the cache
+            backend = self._backend_cache.get(preferred)
+            if backend is not None and backend.is_available():
+                self.logger.info("Using preferred backend: %s", preferred)
+                return backend
+            self.logger.warning("Preferred backend '%s' not available", preferred)
         
         # ─────────────────────────────────────────────────────────────────
         # Auto-select best backend (highest priority)
@@ -196,9 +225,9 @@ class BackendDiscovery:
         info = {}
         
         for name in self.backend_classes:
-            backend_info = self.get_backend_info(name)
-            if backend_info:
-                info[name] = backend_info
+            backend = self.get_backend(name)
+            if backend:
+                info[name] = backend.get_backend_info()
         
         return info
     
@@ -213,13 +242,13 @@ class BackendDiscovery:
             True if backend test successful
         """
         backend = self.get_backend(name)
-        if not backend:
+        if not backend or not backend.is_available():
             return False
         
-        if not backend.is_available():
-            return False
-        
-        # Try to send a test notification
+        return self._run_backend_test(name, backend)
+    
+    def _run_backend_test(self, name: str, backend: NotificationBackend) -> bool:
+        """Send a test notification through an already-resolved backend."""
         try:
             if hasattr(backend, 'test_notification'):
                 return backend.test_notification()
@@ -237,21 +266,50 @@ class BackendDiscovery:
     
     def test_all_backends(self) -> Dict[str, bool]:
         """
-        Test all available backends.
+        Test all available backends, concurrently when there are several.
         
         Returns:
             Dictionary mapping backend names to test results
         """
-        results = {}
-        available_backends = self.discover_available_backends()
+        # Discovery instantiated and probed these already
+        available = self.discover_available_backends()
+        if len(available) < 2:
+            return {name: self._run_backend_test(name, self._backend_cache[name]) for name in available}
         
-        for name in available_backends:
-            results[name] = self.test_backend(name)
-            
-        return results
+        # Tests mostly wait on subprocesses/the daemon, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(available)) as executor:
+            futures = {
+                name: executor.submit(self._run_backend_test, name, self._backend_cache[name])
+                for name in available
+            }
+        return {name: future.result() for name, future in futures.items()}
     
     def clear_cache(self) -> None:
         """Clear backend cache and force re-discovery."""
         self._backend_cache.clear()
         self._available_backends = None
-        self.logger.debug("Cleared backend cache")
\ No newline at end of file
+        self.logger.debug("Cleared backend cache")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Shared discovery instance
+# ═══════════════════════════════════════════════════════════════════════════════
+_global_discovery: Optional[BackendDiscovery] = None
+
+
+def get_backend_discovery() -> BackendDiscovery:
+    """
+    Get the process-wide backend discovery instance.
+    
+    Sharing it means backends are probed once per process (and environment)
+    rather than once per NotificationManager.
+    
+    Returns:
+        BackendDiscovery instance
+    """
+    global _global_discovery
+    
+    if _global_discovery is None:
+        _global_discovery = BackendDiscovery()
+    
+    return _global_discovery
@@ -10,15 +10,67 @@ VERSION: 1.0.0
 Dunst notification backend using dunstify command integration.
 """
 
+import functools
 import logging
+import os
 import shutil
 import subprocess
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional, Callable, Union
+from typing import Any, Dict, List, Optional, Callable, Tuple, Union
 
 from .base import NotificationBackend
 from ..exceptions import BackendError
 
+try:
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # IMPORT jeepney (optional pure-Python D-Bus client)
+    # ═══════════════════════════════════════════════════════════════════════════════
+    from jeepney import DBusAddress, HeaderFields, MessageType, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+    from jeepney.wrappers import unwrap_msg
+    JEEPNEY_AVAILABLE = True
+except ImportError:
+    JEEPNEY_AVAILABLE = False
+
+# ─────────────────────────────────────────────────────────────────
+# freedesktop notification service (what dunstify talks to)
+# ─────────────────────────────────────────────────────────────────
+NOTIFICATIONS_BUS_NAME = "org.freedesktop.Notifications"
+NOTIFICATIONS_PATH = "/org/freedesktop/Notifications"
+NOTIFY_SIGNATURE = "susssasa{sv}i"
+
+# App name dunstify reports, kept so existing dunstrc rules still match
+DBUS_APP_NAME = "dunstify"
+
+# Urgency hint bytes from the notification spec
+DBUS_URGENCY = {'low': 0, 'normal': 1, 'critical': 2}
+
+# dunstify -h hint arguments
+HINT_CATEGORY = "string:category:"
+HINT_DESKTOP_ENTRY = "string:desktop-entry:"
+HINT_PLAY_SOUND = "int:suppress-sound:0"
+
+# Where to look for dunstify when it is not on PATH
+DUNSTIFY_FALLBACK_PATHS = ("/usr/bin/dunstify", "/usr/local/bin/dunstify")
+
+
+# Commands already found, keyed by (command, PATH); misses are not kept so
+# a dunstify installed later is picked up on rediscovery
+_found_commands: Dict[Tuple[str, Optional[str]], str] = {}
+
+
+def _which(command: str, search_path: Optional[str]) -> Optional[str]:
+    """shutil.which(), remembered per command and PATH value once found."""
+    key = (command, search_path)
+    command_path = _found_commands.get(key)
+    if command_path is None:
+        command_path = shutil.which(command, path=search_path)
+        if command_path:
+            _found_commands[key] = command_path
+    return command_path
+
 
 class DunstBackend(NotificationBackend):
     """
@@ -45,20 +97,36 @@ class DunstBackend(NotificationBackend):
         # Validate command availability
         # ─────────────────────────────────────────────────────────────────
         self._command_path = self._find_command()
+        self._base_cmd = (self._command_path,)
+        self._available = self._command_path is not None
+        
+        # ─────────────────────────────────────────────────────────────────
+        # Session bus connection, opened on first use (see _get_dbus)
+        # ─────────────────────────────────────────────────────────────────
+        self._dbus = None
+        self._dbus_unavailable = not JEEPNEY_AVAILABLE
+        
+        # The blocking jeepney connection matches replies to whoever reads
+        # next, so only one thread may talk on it at a time
+        self._dbus_lock = threading.Lock()
+        
+        # dunstify processes launched without waiting, reaped on later sends
+        self._children: List[subprocess.Popen] = []
+        self._children_lock = threading.Lock()
         
     def _find_command(self) -> Optional[str]:
         """Find the dunstify command on the system."""
-        # Try the specified command first
-        command_path = shutil.which(self.command)
-        if command_path:
-            return command_path
-        
-        # Try common alternatives
-        alternatives = ["dunstify", "/usr/bin/dunstify", "/usr/local/bin/dunstify"]
-        for alt in alternatives:
-            alt_path = shutil.which(alt)
-            if alt_path:
-                self.logger.debug(f"Found dunstify at: {alt_path}")
+        # Try the specified command first, then plain dunstify on PATH
+        search_path = os.environ.get("PATH")
+        for name in dict.fromkeys((self.command, "dunstify")):
+            command_path = _which(name, search_path)
+            if command_path:
+                return command_path
+        
+        # Try common install locations missing from PATH
+        for alt_path in DUNSTIFY_FALLBACK_PATHS:
+            if os.path.isfile(alt_path) and os.access(alt_path, os.X_OK):
+                self.logger.debug("Found dunstify at: %s", alt_path)
                 return alt_path
         
         return None
@@ -107,12 +175,15 @@ class DunstBackend(NotificationBackend):
                      - category: Notification category
                      - desktop_entry: Desktop entry name
                      - sound: Whether to play sound
+                     - wait: Wait for dunstify to exit and report its status
+                             (notifications without actions only; default False)
 
         Returns:
             If actions provided: Selected action KEY (str) or None if dismissed/timeout
                                 Returns the KEY, not the label!
                                 Example: {"accept": "Accept Call"} returns "accept"
             If no actions: True if sent successfully, False otherwise
+                           (without wait, True means dunstify was launched)
 
             Note: None can mean either timeout OR user dismissed (cannot distinguish)
 
@@ -147,14 +218,23 @@ class DunstBackend(NotificationBackend):
             return False
         
         try:
+            # ─────────────────────────────────────────────────────────────────
+            # Plain notifications go straight to the daemon over D-Bus when
+            # possible; actions need dunstify to wait for the user's choice
+            # ─────────────────────────────────────────────────────────────────
+            if not actions and self._send_dbus(
+                icon, title, message, notification_id, urgency, timeout, kwargs
+            ):
+                return True
+            
             # Build dunstify command
-            cmd = [self._command_path]
+            cmd = list(self._base_cmd)
             
             # ─────────────────────────────────────────────────────────────────
             # Add notification ID for updates
             # ─────────────────────────────────────────────────────────────────
             if notification_id:
-                cmd.extend(["-r", str(abs(hash(notification_id)) % 1000000)])
+                cmd.extend(["-r", format(self._replaces_id(notification_id), 'd')])
             
             # ─────────────────────────────────────────────────────────────────
             # Add urgency level
@@ -180,14 +260,16 @@ class DunstBackend(NotificationBackend):
             # ─────────────────────────────────────────────────────────────────
             # Handle additional dunst-specific options
             # ─────────────────────────────────────────────────────────────────
-            if "category" in kwargs:
-                cmd.extend(["-h", f"string:category:{kwargs['category']}"])
+            category = kwargs.get("category")
+            if category is not None:
+                cmd += ("-h", HINT_CATEGORY + str(category))
             
-            if "desktop_entry" in kwargs:
-                cmd.extend(["-h", f"string:desktop-entry:{kwargs['desktop_entry']}"])
+            desktop_entry = kwargs.get("desktop_entry")
+            if desktop_entry is not None:
+                cmd += ("-h", HINT_DESKTOP_ENTRY + str(desktop_entry))
             
-            if "sound" in kwargs and kwargs["sound"]:
-                cmd.extend(["-h", "int:suppress-sound:0"])
+            if kwargs.get("sound"):
+                cmd += ("-h", HINT_PLAY_SOUND)
             
             # ─────────────────────────────────────────────────────────────────
             # Add actions if provided
@@ -210,13 +292,13 @@ class DunstBackend(NotificationBackend):
                 # Add actions in consistent order: default first, then others
                 if "default" in actions:
                     cmd.extend(["-A", f"default,{actions['default']}"])
-                    self.logger.debug(f"Added default action (left-click): {actions['default']}")
+                    self.logger.debug("Added default action (left-click): %s", actions['default'])
 
                 # Add non-default actions (right-click context menu)
                 for action_id, label in actions.items():
                     if action_id != "default":
                         cmd.extend(["-A", f"{action_id},{label}"])
-                        self.logger.debug(f"Added context menu action: {action_id}={label}")
+                        self.logger.debug("Added context menu action: %s=%s", action_id, label)
             
             # ─────────────────────────────────────────────────────────────────
             # Add title and message
@@ -224,6 +306,14 @@ class DunstBackend(NotificationBackend):
             cmd.append(title)
             cmd.append(message)
             
+            # ─────────────────────────────────────────────────────────────────
+            # Fire and forget when there is no answer to wait for
+            # ─────────────────────────────────────────────────────────────────
+            if not actions and not kwargs.get("wait", False):
+                self._spawn(cmd)
+                self.logger.debug("Launched dunstify for notification: %s", title)
+                return True
+            
             # ─────────────────────────────────────────────────────────────────
             # Execute command
             # ─────────────────────────────────────────────────────────────────
@@ -241,7 +331,7 @@ class DunstBackend(NotificationBackend):
                 if result.returncode == 0:
                     # Action was selected
                     selected_action = result.stdout.strip()
-                    self.logger.debug(f"Action selected: {selected_action}")
+                    self.logger.debug("Action selected: %s", selected_action)
                     
                     # Call callback if provided
                     if action_callback and selected_action:
@@ -253,11 +343,11 @@ class DunstBackend(NotificationBackend):
                     return selected_action or None
                 elif result.returncode == 1:
                     # Notification timed out
-                    self.logger.debug(f"Notification timed out: {title}")
+                    self.logger.debug("Notification timed out: %s", title)
                     return None
                 elif result.returncode == 2:
                     # Notification was dismissed
-                    self.logger.debug(f"Notification dismissed: {title}")
+                    self.logger.debug("Notification dismissed: %s", title)
                     return None
                 else:
                     self.logger.warning(
@@ -267,7 +357,7 @@ class DunstBackend(NotificationBackend):
             else:
                 # Regular notification without actions
                 if result.returncode == 0:
-                    self.logger.debug(f"Sent notification: {title}")
+                    self.logger.debug("Sent notification: %s", title)
                     return True
                 else:
                     self.logger.warning(
@@ -282,16 +372,229 @@ class DunstBackend(NotificationBackend):
             self.logger.error(f"Failed to send notification: {e}")
             return None if actions else False
     
-    def _resolve_icon_path(self, icon: str) -> Optional[str]:
+    @staticmethod
+    def _replaces_id(notification_id: str) -> int:
+        """Numeric ID the daemon uses to replace a notification with this ID."""
+        return abs(hash(notification_id)) % 1000000
+    
+    def _spawn(self, cmd: List[str]) -> None:
+        """
+        Start dunstify without waiting for it to exit.
+        
+        The process gets its own session so a Ctrl-C in the caller's
+        terminal does not cancel a notification in flight.
+        """
+        child = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        
+        # Reap children that finished since the last send
+        with self._children_lock:
+            self._children = [c for c in self._children if c.poll() is None]
+            self._children.append(child)
+    
+    def _get_dbus(self):
+        """
+        Return the session bus connection, opening it on first use.
+        
+        Returns None (and stops trying) if jeepney is missing or the
+        session bus cannot be reached. Callers must hold _dbus_lock.
+        """
+        if self._dbus is None and not self._dbus_unavailable:
+            try:
+                self._dbus = open_dbus_connection(bus="SESSION")
+                self.logger.debug("Connected to session bus for notifications")
+            except Exception as e:
+                self.logger.debug("D-Bus unavailable, using dunstify: %s", e)
+                self._dbus_unavailable = True
+        return self._dbus
+    
+    def _notify_call(
+        self,
+        icon: str,
+        title: str,
+        message: str,
+        notification_id: Optional[str] = None,
+        urgency: str = 'normal',
+        timeout: Optional[int] = None,
+        **options
+    ):
+        """
+        Build the Notify method call for a notification.
+        
+        Mirrors the arguments dunstify would pass for the same request.
+        """
+        replaces_id = self._replaces_id(notification_id) if notification_id else 0
+        expire_timeout = -1 if timeout is None else self.validate_timeout(timeout)
+        app_icon = (self._resolve_icon_path(icon) or "") if icon else ""
+        
+        hints = {"urgency": ("y", DBUS_URGENCY[self.validate_urgency(urgency)])}
+        category = options.get("category")
+        if category is not None:
+            hints["category"] = ("s", str(category))
+        desktop_entry = options.get("desktop_entry")
+        if desktop_entry is not None:
+            hints["desktop-entry"] = ("s", str(desktop_entry))
+        if options.get("sound"):
+            hints["suppress-sound"] = ("i", 0)
+        
+        address = DBusAddress(
+            NOTIFICATIONS_PATH,
+            bus_name=NOTIFICATIONS_BUS_NAME,
+            interface=NOTIFICATIONS_BUS_NAME
+        )
+        return new_method_call(
+            address, "Notify", NOTIFY_SIGNATURE,
+            (DBUS_APP_NAME, replaces_id, app_icon, title, message, [], hints, expire_timeout)
+        )
+    
+    def _send_dbus(
+        self,
+        icon: str,
+        title: str,
+        message: str,
+        notification_id: Optional[str],
+        urgency: str,
+        timeout: Optional[int],
+        options: Dict[str, Any]
+    ) -> bool:
+        """
+        Send a notification with a single Notify call on the session bus.
+        
+        Returns:
+            True if the daemon accepted it, False to fall back to dunstify
+        """
+        if self._dbus_unavailable:
+            return False
+        
+        call = self._notify_call(icon, title, message, notification_id, urgency, timeout, **options)
+        
+        with self._dbus_lock:
+            connection = self._get_dbus()
+            if connection is None:
+                return False
+            
+            try:
+                unwrap_msg(connection.send_and_get_reply(call, timeout=5))
+            except Exception as e:
+                # Drop the connection; the next send reconnects once
+                self.logger.debug("D-Bus Notify failed, falling back to dunstify: %s", e)
+                self._close_dbus()
+                return False
+        
+        self.logger.debug("Sent notification over D-Bus: %s", title)
+        return True
+    
+    def send_notifications(self, notifications: List[Dict[str, Any]]) -> List[Union[bool, str]]:
+        """
+        Send several notifications, pipelining them over D-Bus when possible.
+        
+        All Notify calls are written to the bus before any reply is read,
+        so a burst costs one round trip instead of one per notification.
+        Calls the daemon refuses, or that never reached the bus, go
+        through send_notification() as usual. Calls left unanswered (the
+        bus timed out or dropped) are reported as failed, not re-sent.
+        Batches containing actions skip D-Bus entirely.
+        """
+        if len(notifications) < 2 or any(n.get("actions") for n in notifications):
+            return super().send_notifications(notifications)
+        
+        results: List[Union[bool, str]] = [False] * len(notifications)
+        with self._dbus_lock:
+            connection = self._get_dbus()
+            if connection is not None:
+                retry = self._pipeline_notify(connection, notifications, results)
+        
+        if connection is None:
+            return super().send_notifications(notifications)
+        
+        self.logger.debug("Sent %s of %s notifications over D-Bus", sum(map(bool, results)), len(notifications))
+        
+        # Outside the lock: send_notification() takes it again
+        for index in retry:
+            results[index] = self.send_notification(**notifications[index])
+        return results
+    
+    def _pipeline_notify(
+        self,
+        connection,
+        notifications: List[Dict[str, Any]],
+        results: List[Union[bool, str]]
+    ) -> List[int]:
+        """
+        Write every Notify call, then collect the replies (hold _dbus_lock).
+        
+        Sets results[i] to True for each notification the daemon confirmed.
+        Calls that were written but never answered stay False: the daemon
+        has most likely shown them already, so they are not retried.
+        
+        Returns:
+            Indices worth retrying with dunstify (refused by the daemon
+            or never written to the bus)
+        """
+        retry: List[int] = []
+        pending: Dict[int, int] = {}
+        written = 0
+        try:
+            for index, notification in enumerate(notifications):
+                serial = next(connection.outgoing_serial)
+                connection.send(self._notify_call(**notification), serial=serial)
+                pending[serial] = index
+                written = index + 1
+            
+            deadline = time.monotonic() + 5
+            while pending:
+                reply = connection.receive(timeout=max(0.0, deadline - time.monotonic()))
+                index = pending.pop(reply.header.fields.get(HeaderFields.reply_serial), None)
+                if index is None:
+                    continue
+                if reply.header.message_type is MessageType.method_return:
+                    results[index] = True
+                else:
+                    retry.append(index)
+        except Exception as e:
+            self.logger.debug("Pipelined D-Bus Notify failed: %s", e)
+            self._close_dbus()
+            if pending:
+                self.logger.warning(
+                    "No reply from notification daemon for %s notifications", len(pending)
+                )
+            retry.extend(range(written, len(notifications)))
+        
+        return retry
+    
+    def _close_dbus(self) -> None:
+        """Close the session bus connection if one is open (hold _dbus_lock)."""
+        connection, self._dbus = self._dbus, None
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _resolve_icon_path(icon: str) -> Optional[str]:
         """
         Resolve icon name/path for dunstify.
         
+        Results are cached per icon string, so a reused icon path is only
+        stat()ed once. A missing absolute path is passed through unchanged
+        either way, so a stale entry cannot hide an icon.
+        
         Args:
             icon: Icon name, path, or unicode character
             
         Returns:
             Resolved icon path or None
         """
+        if not icon:
+            return None
+        
         # If it's already a file path and exists, use it
         icon_path = Path(icon)
         if icon_path.is_absolute() and icon_path.exists():
@@ -299,7 +602,7 @@ class DunstBackend(NotificationBackend):
         
         # For unicode/emoji icons, don't pass to dunstify
         # (dunstify doesn't handle these well)
-        if len(icon) <= 4 and any(ord(c) > 127 for c in icon):
+        if len(icon) <= 4 and not icon.isascii():
             return None
         
         # For named icons, let dunstify resolve them
@@ -308,7 +611,7 @@ class DunstBackend(NotificationBackend):
     
     def is_available(self) -> bool:
         """Check if Dunst backend is available."""
-        return self._command_path is not None
+        return self._available
     
     def get_backend_info(self) -> Dict[str, Any]:
         """Get information about the Dunst backend."""
@@ -332,6 +635,7 @@ class DunstBackend(NotificationBackend):
             ],
             "urgency_levels": ["low", "normal", "critical"],
             "description": "Dunst notification daemon backend using dunstify",
+            "dbus": JEEPNEY_AVAILABLE and not self._dbus_unavailable,
         }
         
         # Add version information if available
@@ -361,5 +665,6 @@ class DunstBackend(NotificationBackend):
             icon="info",
             title="Desktop Notify Test",
             message="Dunst backend is working correctly",
-            timeout=3000
+            timeout=3000,
+            wait=True  # Report dunstify's exit status, not just that it started
         )
\ No newline at end of file
@@ -19,6 +19,10 @@ from config_manager import ConfigManager, ConfigSchema
 from .exceptions import ConfigurationError
 
 
+# Marks a key the underlying config manager has no value for
+_MISSING = object()
+
+
 def create_desktop_notify_schema() -> ConfigSchema:
     """
     Create the configuration schema for desktop notify.
@@ -40,6 +44,9 @@ def create_desktop_notify_schema() -> ConfigSchema:
     main_schema.add_field("enable_sound", bool, default=True)
     main_schema.add_field("log_level", str, default="INFO")
     main_schema.add_field("log_icon_resolution", bool, default=False)
+    main_schema.add_field("coalesce_window_ms", int, default=0)
+    main_schema.add_field("track_last_result", bool, default=True)
+    main_schema.add_field("collect_timings", bool, default=True)
     
     # ─────────────────────────────────────────────────────────────────
     # Icon settings
@@ -53,6 +60,7 @@ def create_desktop_notify_schema() -> ConfigSchema:
     icon_schema.add_field("system_mode", str, default="auto")
     icon_schema.add_field("system_mapping_file", str, default="")
     icon_schema.add_field("fallback_enabled", bool, default=True)
+    icon_schema.add_field("persistent_cache", bool, default=False)
     
     main_schema.add_nested_schema("icons", icon_schema)
     
@@ -124,29 +132,31 @@ class DesktopNotifyConfig:
             auto_load=auto_load
         )
         
+        # ─────────────────────────────────────────────────────────────────
+        # Resolved values by dotted key; cleared whenever the configuration
+        # changes through set() or reload()
+        # ─────────────────────────────────────────────────────────────────
+        self._values: Dict[str, Any] = {}
+        
         if auto_load:
             self.logger.debug("Configuration loaded successfully")
     
     def _get_default_config_paths(self) -> list:
-        """Get default configuration file paths."""
-        paths = []
-        
-        # System-wide configuration
-        system_config = Path("/etc/desktop-notify/config.toml")
-        if system_config.exists():
-            paths.append(system_config)
-        
-        # User configuration
-        user_config_dir = Path.home() / ".config" / "desktop-notify"
-        user_config = user_config_dir / "config.toml"
-        paths.append(user_config)
-        
-        # Local project configuration
-        local_config = Path.cwd() / "desktop-notify.toml"
-        if local_config.exists():
-            paths.append(local_config)
+        """
+        Get default configuration file paths.
         
-        return paths
+        Paths are listed whether or not they exist; ConfigManager skips
+        missing files when it loads, so probing them here would only stat
+        each file twice.
+        """
+        return [
+            # System-wide configuration
+            Path("/etc/desktop-notify/config.toml"),
+            # User configuration
+            Path.home() / ".config" / "desktop-notify" / "config.toml",
+            # Local project configuration
+            Path.cwd() / "desktop-notify.toml",
+        ]
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -159,7 +169,11 @@ class DesktopNotifyConfig:
         Returns:
             Configuration value
         """
-        return self.config_manager.get(key, default)
+        try:
+            value = self._values[key]
+        except KeyError:
+            value = self._values[key] = self.config_manager.get(key, _MISSING)
+        return default if value is _MISSING else value
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -170,10 +184,12 @@ class DesktopNotifyConfig:
             value: Value to set
         """
         self.config_manager.set(key, value, source="runtime")
+        self._values.clear()
     
     def reload(self) -> None:
         """Reload configuration from files."""
         self.config_manager.load()
+        self._values.clear()
         self.logger.debug("Configuration reloaded")
     
     def to_dict(self) -> Dict[str, Any]:
@@ -284,6 +300,16 @@ class DesktopNotifyConfig:
         """Set system icon mapping file path."""
         self.set("icons.system_mapping_file", value)
     
+    @property
+    def icon_persistent_cache(self) -> bool:
+        """Get whether icon resolutions are cached on disk between runs."""
+        return self.get("icons.persistent_cache", False)
+    
+    @icon_persistent_cache.setter
+    def icon_persistent_cache(self, value: bool) -> None:
+        """Set whether icon resolutions are cached on disk between runs."""
+        self.set("icons.persistent_cache", value)
+    
     @property 
     def enable_sound(self) -> bool:
         """Get sound enablement status."""
@@ -315,6 +341,36 @@ class DesktopNotifyConfig:
         """Set icon resolution logging setting."""
         self.set("notification.log_icon_resolution", value)
     
+    @property
+    def coalesce_window_ms(self) -> int:
+        """Get the window for coalescing queued updates to one notification_id."""
+        return self.get("notification.coalesce_window_ms", 0)
+    
+    @coalesce_window_ms.setter
+    def coalesce_window_ms(self, value: int) -> None:
+        """Set the window for coalescing queued updates to one notification_id."""
+        self.set("notification.coalesce_window_ms", value)
+    
+    @property
+    def track_last_result(self) -> bool:
+        """Get whether send() records a NotificationResult for every notification."""
+        return self.get("notification.track_last_result", True)
+    
+    @track_last_result.setter
+    def track_last_result(self, value: bool) -> None:
+        """Set whether send() records a NotificationResult for every notification."""
+        self.set("notification.track_last_result", value)
+    
+    @property
+    def collect_timings(self) -> bool:
+        """Get whether send timings are recorded on NotificationResult."""
+        return self.get("notification.collect_timings", True)
+    
+    @collect_timings.setter
+    def collect_timings(self, value: bool) -> None:
+        """Set whether send timings are recorded on NotificationResult."""
+        self.set("notification.collect_timings", value)
+    
     # ─────────────────────────────────────────────────────────────────
     # Backend-specific configuration
     # ─────────────────────────────────────────────────────────────────
@@ -362,10 +418,11 @@ def get_config(reload: bool = False) -> DesktopNotifyConfig:
     """
     global _global_config
     
-    if _global_config is None or reload:
+    # Built once per process; reload re-reads the files into the same
+    # instance, so holders of the object see the new values
+    if _global_config is None:
         _global_config = DesktopNotifyConfig()
-    
-    if reload and _global_config:
+    elif reload:
         _global_config.reload()
     
     return _global_config
\ No newline at end of file
@@ -9,6 +9,7 @@ integration with icon_mapper.IconResolver for system icons.
 """
 
 from .base import IconSet
+from .cache import IconResolutionCache, get_icon_resolution_cache
 from .manager import IconSetManager, get_icon_set_manager
 from .system import SystemIconSet
 from .material import MaterialIconSet
@@ -17,6 +18,8 @@ from .minimal import MinimalIconSet
 
 __all__ = [
     "IconSet",
+    "IconResolutionCache",
+    "get_icon_resolution_cache",
     "IconSetManager",
     "get_icon_set_manager",
     "SystemIconSet",
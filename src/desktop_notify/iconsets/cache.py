@@ -0,0 +1,233 @@
+# ────────────────────────────────────────────────────────────────────────────────
+# Persistent Icon Resolution Cache
+# ────────────────────────────────────────────────────────────────────────────────
+"""
+cache.py
+AUTHOR: Desktop Notify Team
+DATE: 2024-01-15
+VERSION: 1.0.0
+
+On-disk cache of icon resolutions, so a new process can skip walking icon
+sets and theme directories for icons it has resolved before.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..types import IconResolutionInfo, IconResolutionSource
+
+
+def default_cache_path() -> Path:
+    """Location of the cache file ($XDG_CACHE_HOME/desktop_notify/icons.json)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "desktop_notify" / "icons.json"
+
+
+class IconResolutionCache:
+    """
+    ///////////////////////////////////////////////////////////////////
+    ICON RESOLUTION CACHE
+    ▄▄▄▄ ▄▄▄  ▄▄▄▄ ▄  ▄ ▄▄▄▄
+    █    █▀█  █    █▄▄█ █▄▄▄
+    █▄▄▄ █ █  █▄▄▄ █  █ █▄▄▄
+    ///////////////////////////////////////////////////////////////////
+    Icon resolutions keyed by (icon set, icon name), kept between runs.
+    
+    Entries that point at a file remember its mtime and are dropped when
+    the file changes or disappears. Glyph results are kept as they are.
+    The file also records the icon settings it was built with (system
+    theme, size, scalable preference); a file built with other settings
+    is discarded as a whole.
+    """
+    
+    def __init__(self, path: Optional[Path] = None, fingerprint: Sequence[Any] = ()):
+        """
+        Initialize the cache and load it from disk.
+        
+        Args:
+            path: Cache file (defaults to default_cache_path())
+            fingerprint: JSON-serializable icon settings the resolutions
+                         depend on
+        """
+        self.path = Path(path) if path else default_cache_path()
+        self.logger = logging.getLogger(__name__)
+        self.fingerprint: List[Any] = list(fingerprint)
+        
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        
+        self._load()
+    
+    @staticmethod
+    def _key(icon_set: Optional[str], name: str) -> str:
+        """JSON object key for an (icon set, icon name) pair."""
+        return f"{icon_set or ''}\t{name}"
+    
+    def _load(self) -> None:
+        """Read the cache file, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.logger.debug("Ignoring unreadable icon cache %s: %s", self.path, e)
+            return
+        
+        if not isinstance(data, dict) or data.get("fingerprint") != self.fingerprint:
+            self.logger.debug("Ignoring icon cache %s built with other icon settings", self.path)
+            return
+        
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            self._entries = {
+                key: entry for key, entry in entries.items() if isinstance(entry, dict)
+            }
+    
+    def use_fingerprint(self, fingerprint: Sequence[Any]) -> None:
+        """
+        Switch to other icon settings, forgetting every entry if they differ.
+        
+        Args:
+            fingerprint: JSON-serializable icon settings the resolutions
+                         depend on
+        """
+        fingerprint = list(fingerprint)
+        with self._lock:
+            if fingerprint != self.fingerprint:
+                self.fingerprint = fingerprint
+                self._entries.clear()
+                self._dirty = True
+    
+    def get(self, icon_set: Optional[str], name: str) -> Optional[IconResolutionInfo]:
+        """
+        Look up a resolution made earlier with the same icon set.
+        
+        Args:
+            icon_set: Icon set that was active
+            name: Icon name
+        
+        Returns:
+            IconResolutionInfo marked cached, or None if unknown or stale
+        """
+        key = self._key(icon_set, name)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        try:
+            mtime = entry.get("mtime")
+            if mtime is not None:
+                try:
+                    current = os.stat(entry["resolved_path"]).st_mtime
+                except OSError:
+                    current = None
+                if current != mtime:
+                    raise ValueError("stale")
+            
+            return IconResolutionInfo(
+                original_name=name,
+                resolved_path=entry["resolved_path"],
+                source=IconResolutionSource(entry["source"]),
+                icon_set_used=entry.get("icon_set_used"),
+                is_fallback=entry.get("is_fallback", False),
+                cached=True
+            )
+        except (KeyError, TypeError, ValueError):
+            with self._lock:
+                self._entries.pop(key, None)
+                self._dirty = True
+            return None
+    
+    def put(self, icon_set: Optional[str], info: IconResolutionInfo) -> None:
+        """
+        Remember a successful resolution.
+        
+        Fallbacks are not stored: the icon may be installed later.
+        
+        Args:
+            icon_set: Icon set that was active
+            info: Resolution to store
+        """
+        if (
+            not info.resolved_path
+            or info.is_fallback
+            or info.source in (IconResolutionSource.FALLBACK, IconResolutionSource.NOT_FOUND)
+        ):
+            return
+        
+        mtime = None
+        if os.path.isabs(info.resolved_path):
+            try:
+                mtime = os.stat(info.resolved_path).st_mtime
+            except OSError:
+                return
+        
+        with self._lock:
+            self._entries[self._key(icon_set, info.original_name)] = {
+                "resolved_path": info.resolved_path,
+                "source": info.source.value,
+                "icon_set_used": info.icon_set_used,
+                "is_fallback": info.is_fallback,
+                "mtime": mtime,
+            }
+            self._dirty = True
+    
+    def save(self) -> None:
+        """Write the cache to disk if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps({"fingerprint": self.fingerprint, "entries": self._entries})
+            self._dirty = False
+        
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(data, encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.debug("Could not write icon cache %s: %s", self.path, e)
+    
+    def clear(self) -> None:
+        """Forget every entry (the file is rewritten on the next save)."""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Global icon resolution cache instance
+# ═══════════════════════════════════════════════════════════════════════════════
+_global_icon_cache: Optional[IconResolutionCache] = None
+
+
+def get_icon_resolution_cache(fingerprint: Sequence[Any] = ()) -> IconResolutionCache:
+    """
+    Get the global icon resolution cache, loading it on first use.
+    
+    The cache is written back when the interpreter exits.
+    
+    Args:
+        fingerprint: JSON-serializable icon settings the resolutions depend
+                     on; entries made with other settings are dropped
+    
+    Returns:
+        IconResolutionCache instance
+    """
+    global _global_icon_cache
+    
+    if _global_icon_cache is None:
+        _global_icon_cache = IconResolutionCache(fingerprint=fingerprint)
+        atexit.register(_global_icon_cache.save)
+    else:
+        _global_icon_cache.use_fingerprint(fingerprint)
+    
+    return _global_icon_cache
+
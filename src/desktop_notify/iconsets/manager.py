@@ -99,7 +99,7 @@ class IconSetManager:
             try:
                 icon_set = icon_set_class(**kwargs)
                 self.icon_sets[icon_set.name] = icon_set
-                self.logger.debug(f"Registered icon set: {icon_set.name}")
+                self.logger.debug("Registered icon set: %s", icon_set.name)
             except Exception as e:
                 self.logger.warning(f"Failed to initialize {icon_set_class.__name__}: {e}")
     
@@ -122,7 +122,7 @@ class IconSetManager:
                     for set_name, icon_set in available_sets:
                         if self._validate_icon_set(set_name):
                             self.active_icon_set = set_name
-                            self.logger.info(f"Auto-selected icon set: {self.active_icon_set} (all icons validated)")
+                            self.logger.info("Auto-selected icon set: %s (all icons validated)", self.active_icon_set)
                             return
                     
                     # No set has all required icons, use material-complete
@@ -136,7 +136,7 @@ class IconSetManager:
                 else:
                     # Non all-or-nothing mode - use highest priority
                     self.active_icon_set = available_sets[0][0]
-                    self.logger.info(f"Auto-selected icon set: {self.active_icon_set}")
+                    self.logger.info("Auto-selected icon set: %s", self.active_icon_set)
             else:
                 self.logger.warning("No icon sets available")
                 
@@ -156,7 +156,7 @@ class IconSetManager:
                             self.logger.warning("Continuing with incomplete icon set")
                     else:
                         self.active_icon_set = self.preferred_icon_set
-                        self.logger.info(f"Using preferred icon set: {self.active_icon_set}")
+                        self.logger.info("Using preferred icon set: %s", self.active_icon_set)
                 else:
                     self.logger.warning(f"Preferred icon set '{self.preferred_icon_set}' not available")
                     self._select_active_icon_set_fallback()
@@ -221,7 +221,7 @@ class IconSetManager:
             is_valid = len(missing) == 0
             
             if not is_valid:
-                self.logger.debug(f"Icon set '{set_name}' missing icons: {missing}")
+                self.logger.debug("Icon set '%s' missing icons: %s", set_name, missing)
         else:
             # For other icon sets, check each icon individually
             missing = []
@@ -231,7 +231,7 @@ class IconSetManager:
             
             is_valid = len(missing) == 0
             if not is_valid:
-                self.logger.debug(f"Icon set '{set_name}' missing icons: {missing}")
+                self.logger.debug("Icon set '%s' missing icons: %s", set_name, missing)
         
         self._validation_cache[cache_key] = is_valid
         return is_valid
@@ -272,7 +272,7 @@ class IconSetManager:
         for set_name, icon_set in fallback_sets:
             icon = icon_set.get_icon(name)
             if icon is not None:
-                self.logger.debug(f"Found '{name}' in fallback set: {set_name}")
+                self.logger.debug("Found '%s' in fallback set: %s", name, set_name)
                 return icon
         
         # Ultimate fallback - return unknown icon from minimal set
@@ -292,7 +292,7 @@ class IconSetManager:
         Returns:
             IconResolutionInfo with complete resolution details
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Initialize resolution info
         resolution_info = IconResolutionInfo(
@@ -311,15 +311,15 @@ class IconSetManager:
             if path.exists() and path.is_file():
                 resolution_info.resolved_path = str(path)
                 resolution_info.source = IconResolutionSource.FILE_PATH
-                resolution_info.resolution_time_ms = (time.time() - start_time) * 1000
+                resolution_info.resolution_time_ms = (time.perf_counter() - start_time) * 1000
                 self._last_resolution = resolution_info
                 return resolution_info
         
         # Check if it's a unicode character/emoji
-        if len(name) <= 4 and any(ord(c) > 127 for c in name):
+        if len(name) <= 4 and not name.isascii():
             resolution_info.resolved_path = name
             resolution_info.source = IconResolutionSource.UNICODE
-            resolution_info.resolution_time_ms = (time.time() - start_time) * 1000
+            resolution_info.resolution_time_ms = (time.perf_counter() - start_time) * 1000
             self._last_resolution = resolution_info
             return resolution_info
         
@@ -340,12 +340,12 @@ class IconSetManager:
                 if hasattr(active_set, 'get_icon_size'):
                     resolution_info.size = getattr(active_set, 'get_icon_size')()
                 
-                resolution_info.resolution_time_ms = (time.time() - start_time) * 1000
+                resolution_info.resolution_time_ms = (time.perf_counter() - start_time) * 1000
                 self._last_resolution = resolution_info
                 return resolution_info
         
         if not fallback:
-            resolution_info.resolution_time_ms = (time.time() - start_time) * 1000
+            resolution_info.resolution_time_ms = (time.perf_counter() - start_time) * 1000
             self._last_resolution = resolution_info
             return resolution_info
         
@@ -375,8 +375,8 @@ class IconSetManager:
                 if hasattr(icon_set, 'get_icon_size'):
                     resolution_info.size = getattr(icon_set, 'get_icon_size')()
                 
-                self.logger.debug(f"Found '{name}' in fallback set: {set_name}")
-                resolution_info.resolution_time_ms = (time.time() - start_time) * 1000
+                self.logger.debug("Found '%s' in fallback set: %s", name, set_name)
+                resolution_info.resolution_time_ms = (time.perf_counter() - start_time) * 1000
                 self._last_resolution = resolution_info
                 return resolution_info
         
@@ -393,7 +393,7 @@ class IconSetManager:
                 resolution_info.is_fallback = True
                 resolution_info.original_name = name  # Keep original name
         
-        resolution_info.resolution_time_ms = (time.time() - start_time) * 1000
+        resolution_info.resolution_time_ms = (time.perf_counter() - start_time) * 1000
         self._last_resolution = resolution_info
         return resolution_info
     
@@ -402,6 +402,7 @@ class IconSetManager:
         source_map = {
             "system": IconResolutionSource.SYSTEM_THEME,
             "material": IconResolutionSource.MATERIAL,
+            "material-complete": IconResolutionSource.MATERIAL,
             "nerdfonts": IconResolutionSource.NERDFONTS,
             "minimal": IconResolutionSource.MINIMAL,
         }
@@ -441,7 +442,7 @@ class IconSetManager:
         # Clear cache when switching icon sets
         self.get_icon.cache_clear()
         
-        self.logger.info(f"Switched to icon set: {name}")
+        self.logger.info("Switched to icon set: %s", name)
         return True
     
     def get_active_icon_set(self) -> Optional[str]:
@@ -506,7 +507,7 @@ class IconSetManager:
             icon_set: IconSet instance to register
         """
         self.icon_sets[icon_set.name] = icon_set
-        self.logger.info(f"Registered custom icon set: {icon_set.name}")
+        self.logger.info("Registered custom icon set: %s", icon_set.name)
         
         # Clear cache to include new icon set
         self.get_icon.cache_clear()
@@ -526,7 +527,7 @@ class IconSetManager:
         """
         if self._all_or_nothing_mode != enabled:
             self._all_or_nothing_mode = enabled
-            self.logger.info(f"All-or-nothing mode: {'enabled' if enabled else 'disabled'}")
+            self.logger.info("All-or-nothing mode: %s", 'enabled' if enabled else 'disabled')
             
             # Re-select active icon set with new mode
             self._select_active_icon_set()
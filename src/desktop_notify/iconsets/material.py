@@ -153,7 +153,7 @@ class MaterialIconSet(IconSet):
             if icon_path.exists():
                 return str(icon_path)
             else:
-                self.logger.debug(f"Material icon file not found: {icon_path}")
+                self.logger.debug("Material icon file not found: %s", icon_path)
         
         # Try direct filename lookup
         direct_path = self.icons_dir / f"{name}.svg"
@@ -188,7 +188,7 @@ class MaterialIconSet(IconSet):
     def create_icon_directory(self) -> None:
         """Create the icons directory if it doesn't exist."""
         self.icons_dir.mkdir(parents=True, exist_ok=True)
-        self.logger.info(f"Created Material icons directory: {self.icons_dir}")
+        self.logger.info("Created Material icons directory: %s", self.icons_dir)
     
     def download_icons(self) -> bool:
         """
@@ -191,7 +191,7 @@ class MaterialCompleteIconSet(IconSet):
             if icon_path.exists():
                 return str(icon_path)
             else:
-                self.logger.debug(f"Material icon file not found: {icon_path}")
+                self.logger.debug("Material icon file not found: %s", icon_path)
         
         # Try common alternatives/aliases
         aliases = {
@@ -223,13 +223,13 @@ class MaterialCompleteIconSet(IconSet):
             if normalized_name.startswith(prefix):
                 fallback_path = self.icons_dir / fallback_icon
                 if fallback_path.exists():
-                    self.logger.debug(f"Using category fallback for '{name}': {fallback_icon}")
+                    self.logger.debug("Using category fallback for '%s': %s", name, fallback_icon)
                     return str(fallback_path)
         
         # Ultimate fallback - help outline icon
         help_path = self.icons_dir / "help_outline.svg"
         if help_path.exists():
-            self.logger.debug(f"Using help_outline fallback for '{name}'")
+            self.logger.debug("Using help_outline fallback for '%s'", name)
             return str(help_path)
         
         return None
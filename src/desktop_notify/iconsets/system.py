@@ -107,7 +107,7 @@ class SystemIconSet(IconSet):
         ─────────────────────────────────────────────────────────────────
         """
         if not self.is_available():
-            self.logger.debug(f"❌ SystemIconSet not available for '{name}'")
+            self.logger.debug("❌ SystemIconSet not available for '%s'", name)
             return None
         
         # Check cache first
@@ -135,7 +135,7 @@ class SystemIconSet(IconSet):
                 if self._should_log_resolution():
                     self.logger.info(f"✅ Icon '{name}' → '{resolved_path}'")
                 else:
-                    self.logger.debug(f"Resolved '{name}' -> '{resolved_path}'")
+                    self.logger.debug("Resolved '%s' -> '%s'", name, resolved_path)
                 
                 return resolved_path
             else:
@@ -146,7 +146,7 @@ class SystemIconSet(IconSet):
             if self._should_log_resolution():
                 self.logger.error(f"💥 Icon '{name}' resolution failed: {e}")
             else:
-                self.logger.debug(f"Failed to resolve icon '{name}': {e}")
+                self.logger.debug("Failed to resolve icon '%s': %s", name, e)
         
         # Cache negative results to avoid repeated lookups
         self._cache[name] = None
@@ -256,7 +256,7 @@ class SystemIconSet(IconSet):
             if theme_name is not None:
                 success = self._resolver.set_theme(self.theme_name)
                 if success:
-                    self.logger.debug(f"Updated IconResolver theme to: {self.theme_name}")
+                    self.logger.debug("Updated IconResolver theme to: %s", self.theme_name)
                 else:
                     self.logger.warning(f"Failed to set theme to: {self.theme_name}")
             
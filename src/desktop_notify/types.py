@@ -27,7 +27,7 @@ class IconResolutionSource(Enum):
     NOT_FOUND = "not_found"          # Icon not resolved
 
 
-@dataclass
+@dataclass(slots=True)
 class IconResolutionInfo:
     """
     Detailed information about icon resolution.
@@ -114,7 +114,7 @@ class IconResolutionInfo:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationResult:
     """
     Result of sending a notification with detailed information.
@@ -3,15 +3,18 @@
 Debug action interactions step by step
 """
 
+import functools
 import subprocess
 import time
 
 def test_dunstify_direct():
     """Test dunstify actions directly."""
-    print("🔍 Testing dunstify actions directly...")
-    print("   A notification should appear.")
-    print("   Try right-clicking on it.")
-    print("   This will timeout in 10 seconds if no action is taken.")
+    print(
+        "🔍 Testing dunstify actions directly...\n"
+        "   A notification should appear.\n"
+        "   Try right-clicking on it.\n"
+        "   This will timeout in 10 seconds if no action is taken."
+    )
     
     # Test with dunstify directly
     result = subprocess.run([
@@ -21,7 +24,7 @@ def test_dunstify_direct():
         "-t", "10000",  # 10 second timeout
         "Action Test", 
         "Right-click this notification!"
-    ], capture_output=True, text=True)
+    ], stdout=subprocess.PIPE, text=True)  # dunstify errors go straight to the terminal
     
     print(f"   dunstify return code: {result.returncode}")
     
@@ -38,35 +41,49 @@ def test_dunstify_direct():
     else:
         print(f"   ❓ Unexpected return code: {result.returncode}")
         print(f"   stdout: {result.stdout}")
-        print(f"   stderr: {result.stderr}")
         return None
 
+@functools.lru_cache(maxsize=1)
+def _dunst_capabilities():
+    """
+    Capabilities reported by `dunstify --capabilities`, probed once per process.
+    
+    Raises RuntimeError with dunstify's stderr if the probe fails (failures
+    are not cached).
+    """
+    result = subprocess.run(["dunstify", "--capabilities"], capture_output=True, text=True)
+    
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    
+    return frozenset(result.stdout.split())
+
 def test_capabilities():
     """Check Dunst capabilities."""
     print("\n🔍 Checking Dunst capabilities...")
     
-    result = subprocess.run(["dunstify", "--capabilities"], capture_output=True, text=True)
+    try:
+        capabilities = _dunst_capabilities()
+    except RuntimeError as e:
+        print(f"   ❌ Could not get capabilities: {e}")
+        return False
     
-    if result.returncode == 0:
-        capabilities = result.stdout.strip().split('\n')
-        print("   Supported capabilities:")
-        for cap in capabilities:
-            print(f"     - {cap}")
-        
-        if "actions" in capabilities:
-            print("   ✅ Actions are supported!")
-            return True
-        else:
-            print("   ❌ Actions are NOT supported!")
-            return False
+    print("   Supported capabilities:")
+    print("".join(f"     - {cap}\n" for cap in sorted(capabilities)), end="")
+    
+    if "actions" in capabilities:
+        print("   ✅ Actions are supported!")
+        return True
     else:
-        print(f"   ❌ Could not get capabilities: {result.stderr}")
+        print("   ❌ Actions are NOT supported!")
         return False
 
 def test_single_action():
     """Test with a single action (should work with middle-click too)."""
-    print("\n🔍 Testing single action...")
-    print("   Try right-clicking OR middle-clicking this notification")
+    print(
+        "\n🔍 Testing single action...\n"
+        "   Try right-clicking OR middle-clicking this notification"
+    )
     
     result = subprocess.run([
         "dunstify",
@@ -74,7 +91,7 @@ def test_single_action():
         "-t", "15000",
         "Single Action Test",
         "Click this notification!"
-    ], capture_output=True, text=True)
+    ], stdout=subprocess.PIPE, text=True)  # dunstify errors go straight to the terminal
     
     print(f"   Return code: {result.returncode}")
     if result.returncode == 0:
@@ -85,15 +102,16 @@ def test_single_action():
         return False
 
 def main():
-    print("🔧 Dunst Action Debugging")
-    print("=" * 50)
+    print(f"🔧 Dunst Action Debugging\n{'=' * 50}")
     
     # Step 1: Check capabilities
     supports_actions = test_capabilities()
     
     if not supports_actions:
-        print("\n❌ Your Dunst installation doesn't support actions!")
-        print("   You may need to update Dunst or check compilation flags.")
+        print(
+            "\n❌ Your Dunst installation doesn't support actions!\n"
+            "   You may need to update Dunst or check compilation flags."
+        )
         return 1
     
     input("\nPress ENTER to test actions...")
@@ -109,15 +127,19 @@ def main():
         # Step 3: Try single action
         time.sleep(2)
         if test_single_action():
-            print("\n✅ Single actions work!")
-            print("   Issue might be with multi-action context menu.")
+            print(
+                "\n✅ Single actions work!\n"
+                "   Issue might be with multi-action context menu."
+            )
         else:
-            print("\n❌ Even single actions don't work.")
-            print("\n🔍 TROUBLESHOOTING SUGGESTIONS:")
-            print("   1. Check if notifications appear at all")
-            print("   2. Try clicking directly on the notification text")
-            print("   3. Check Dunst logs: journalctl -u dunst")
-            print("   4. Verify mouse settings in your desktop environment")
+            print(
+                "\n❌ Even single actions don't work.\n"
+                "\n🔍 TROUBLESHOOTING SUGGESTIONS:\n"
+                "   1. Check if notifications appear at all\n"
+                "   2. Try clicking directly on the notification text\n"
+                "   3. Check Dunst logs: journalctl -u dunst\n"
+                "   4. Verify mouse settings in your desktop environment"
+            )
     
     return 0
 
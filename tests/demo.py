@@ -32,17 +32,13 @@ def setup_logging(verbose: bool = False):
 
 def print_header(title: str, width: int = 60):
     """Print a formatted header."""
-    print()
-    print("═" * width)
-    print(f" {title}")
-    print("═" * width)
+    rule = "═" * width
+    print(f"\n{rule}\n {title}\n{rule}")
 
 
 def print_section(title: str, width: int = 40):
     """Print a formatted section header."""
-    print()
-    print(f"🔸 {title}")
-    print("─" * width)
+    print(f"\n🔸 {title}\n{'─' * width}")
 
 
 def check_system():
@@ -192,17 +188,19 @@ def demo_interactive_actions():
         manager.send("info", "Interactive Demo", "This backend doesn't support action buttons")
         return
     
-    print("✅ Backend supports interactive actions!")
-    print()
-    print("🔍 INTERACTION INSTRUCTIONS:")
-    print("   1. Notifications will appear on your desktop")
-    print("   2. RIGHT-CLICK on the notification to open context menu")
-    print("   3. Select an action from the context menu")
-    print("   4. The demo will show your selection")
-    print("   5. If no action is taken, the notification will timeout")
-    print()
-    print("   NOTE: Your Dunst config now has right-click = context ✅")
-    print()
+    # One write for the whole block so it is not split up by other output
+    print(
+        "✅ Backend supports interactive actions!\n"
+        "\n"
+        "🔍 INTERACTION INSTRUCTIONS:\n"
+        "   1. Notifications will appear on your desktop\n"
+        "   2. RIGHT-CLICK on the notification to open context menu\n"
+        "   3. Select an action from the context menu\n"
+        "   4. The demo will show your selection\n"
+        "   5. If no action is taken, the notification will timeout\n"
+        "\n"
+        "   NOTE: Your Dunst config now has right-click = context ✅\n"
+    )
     input("Press ENTER when ready to start interactive demos...")
     
     # Simple yes/no confirmation
@@ -512,10 +510,11 @@ def demo_icon_showcase():
         ('busy', 'Busy', 'System busy'),
     ]
     
-    print(f"Showcasing {len(all_icons)} standard icons...")
-    print("Each icon will be displayed for 4 seconds.")
-    print("Press Ctrl+C to interrupt the showcase.")
-    print()
+    print(
+        f"Showcasing {len(all_icons)} standard icons...\n"
+        "Each icon will be displayed for 4 seconds.\n"
+        "Press Ctrl+C to interrupt the showcase.\n"
+    )
     
     input("Press ENTER to start the icon showcase...")
     
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Check batched and background delivery against a fake backend.
+
+Covers send_many(), send_async() with flush()/close(), cancellation,
+critical-first ordering, coalescing of updates to one notification_id and
+the pipelined D-Bus send of the dunst backend (with a fake connection).
+No notification daemon is needed.
+"""
+
+import itertools
+import threading
+from types import SimpleNamespace
+
+from desktop_notify.api import NotificationManager
+from desktop_notify.backends.base import NotificationBackend
+from desktop_notify.backends.dunst import JEEPNEY_AVAILABLE, DunstBackend
+from desktop_notify.config import get_config
+
+
+class FakeBackend(NotificationBackend):
+    """Records notifications instead of showing them."""
+
+    def __init__(self):
+        self.sent = []          # titles, in the order they were sent
+        self.batches = 0        # send_notifications() calls
+        self.started = threading.Event()
+        self.gate = threading.Event()
+        self.gate.set()         # clear to hold up the sender
+
+    @property
+    def name(self):
+        return "fake"
+
+    @property
+    def priority(self):
+        return 0
+
+    def send_notification(self, icon, title, message, actions=None, **kwargs):
+        self.started.set()
+        self.gate.wait(5)
+        self.sent.append(title)
+        if actions:
+            return next(iter(actions))
+        return title != "fail"
+
+    def send_notifications(self, notifications):
+        self.batches += 1
+        return super().send_notifications(notifications)
+
+    def is_available(self):
+        return True
+
+    def get_backend_info(self):
+        return {"name": self.name, "priority": self.priority}
+
+
+def _manager(backend):
+    """Manager sending through backend."""
+    manager = NotificationManager()
+    manager.backend = backend
+    return manager
+
+
+def _hold_sender(manager, backend):
+    """Queue a notification and keep the sender thread busy with it."""
+    backend.gate.clear()
+    backend.started.clear()
+    first = manager.send_async("info", "first", "Holds up the sender")
+    assert backend.started.wait(5), "sender thread never picked up the first notification"
+    return first
+
+
+def test_send_many_order():
+    """send_many() returns one result per notification, in order."""
+    print("\n🔍 send_many(): result order and count")
+    backend = FakeBackend()
+    with _manager(backend) as manager:
+        results = manager.send_many([
+            {"icon": "info", "title": "one", "message": "m", "notification_id": "1"},
+            {"icon": "info", "title": "fail", "message": "m", "notification_id": "2"},
+            {"icon": "question", "title": "ask", "message": "m", "notification_id": "3",
+             "actions": {"yes": "Yes"}},
+            {"icon": "info", "title": "four", "message": "m", "notification_id": "4"},
+            {"icon": "info", "title": "five", "message": "m", "notification_id": "5"},
+        ])
+
+    assert len(results) == 5, results
+    assert [r.notification_id for r in results] == ["1", "2", "3", "4", "5"]
+    assert [r.success for r in results] == [True, False, True, True, True]
+    assert results[2].action_result == "yes"
+    assert backend.sent == ["one", "fail", "ask", "four", "five"]
+    # Notifications without actions around the one with actions go in two batches
+    assert backend.batches == 2, backend.batches
+    print("   ✅ 5 results in order, actions sent on their own")
+
+
+def test_send_async_and_flush():
+    """flush() returns once everything queued has been sent."""
+    print("\n🔍 send_async(): flush() drains the queue")
+    backend = FakeBackend()
+    with _manager(backend) as manager:
+        first = _hold_sender(manager, backend)
+        futures = [manager.send_async("info", f"n{i}", "m") for i in range(3)]
+        assert not manager.flush(timeout=0.1), "flush() should time out while the sender is held"
+
+        backend.gate.set()
+        assert manager.flush(timeout=5)
+        assert all(f.done() for f in [first, *futures])
+        assert [f.result() for f in futures] == [True, True, True]
+        assert backend.sent == ["first", "n0", "n1", "n2"]
+
+        try:
+            manager.send_async("question", "ask", "m", actions={"yes": "Yes"})
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("send_async() accepted actions")
+    print("   ✅ queue drained, futures settled, actions rejected")
+
+
+def test_cancelled_future_dropped():
+    """A Future cancelled while queued is never sent."""
+    print("\n🔍 send_async(): cancelled notifications are dropped")
+    backend = FakeBackend()
+    with _manager(backend) as manager:
+        _hold_sender(manager, backend)
+        dropped = manager.send_async("info", "dropped", "m")
+        kept = manager.send_async("info", "kept", "m")
+        assert dropped.cancel()
+
+        backend.gate.set()
+        assert kept.result(timeout=5) is True
+        manager.flush(timeout=5)
+
+    assert dropped.cancelled()
+    assert backend.sent == ["first", "kept"], backend.sent
+    print("   ✅ cancelled notification skipped")
+
+
+def test_critical_first_per_id_order():
+    """Critical notifications jump the queue, but not earlier updates to the same ID."""
+    print("\n🔍 send_async(): critical first, updates to one ID stay in order")
+    backend = FakeBackend()
+    with _manager(backend) as manager:
+        _hold_sender(manager, backend)
+        manager.send_async("info", "p1", "m", notification_id="p")
+        manager.send_async("info", "other", "m")
+        manager.send_async("info", "p2", "m", notification_id="p", urgency="critical")
+        manager.send_async("error", "alert", "m", urgency="critical")
+        backend.gate.set()
+
+    assert backend.sent == ["first", "alert", "p1", "p2", "other"], backend.sent
+    print("   ✅ delivery order:", ", ".join(backend.sent))
+
+
+def test_coalescing():
+    """Updates to one notification_id within the window are sent once."""
+    print("\n🔍 send_async(): coalescing folds updates into one send")
+    config = get_config()
+    previous = config.coalesce_window_ms
+    config.coalesce_window_ms = 200
+    try:
+        backend = FakeBackend()
+        with _manager(backend) as manager:
+            futures = [
+                manager.send_async("info", f"update {i}", "m", notification_id="progress")
+                for i in range(5)
+            ]
+            assert manager.flush(timeout=5)
+    finally:
+        config.coalesce_window_ms = previous
+
+    assert backend.sent == ["update 4"], backend.sent
+    assert [f.result(timeout=0) for f in futures] == [True] * 5
+    print("   ✅ 5 updates, 1 send, every Future settled")
+
+
+def test_close_stops_sender():
+    """close() delivers what is queued and stops the sender thread."""
+    print("\n🔍 close(): queue delivered, sender stopped")
+    backend = FakeBackend()
+    manager = _manager(backend)
+    futures = [manager.send_async("info", f"n{i}", "m") for i in range(3)]
+    manager.close(timeout=5)
+
+    assert [f.result(timeout=0) for f in futures] == [True, True, True]
+    assert not any(
+        thread.name == "desktop-notify-sender" and thread.is_alive()
+        for thread in threading.enumerate()
+    )
+
+    # Sending again starts a new sender
+    assert manager.send_async("info", "again", "m").result(timeout=5) is True
+    manager.close(timeout=5)
+    print("   ✅ sender stopped and restarted on demand")
+
+
+class FakeConnection:
+    """Session bus stand-in that answers Notify calls in reverse order."""
+
+    def __init__(self, refuse=(), unanswered=()):
+        self.outgoing_serial = itertools.count(1)
+        self.refuse = set(refuse)           # serials answered with an error
+        self.unanswered = set(unanswered)   # serials never answered
+        self.replies = []
+
+    def send(self, message, serial):
+        if serial in self.unanswered:
+            return
+        from jeepney import HeaderFields, MessageType
+        message_type = MessageType.error if serial in self.refuse else MessageType.method_return
+        self.replies.insert(0, SimpleNamespace(header=SimpleNamespace(
+            fields={HeaderFields.reply_serial: serial},
+            message_type=message_type,
+        )))
+
+    def receive(self, timeout=None):
+        if not self.replies:
+            raise TimeoutError("no reply")
+        return self.replies.pop(0)
+
+    def close(self):
+        pass
+
+
+def test_pipeline_notify():
+    """Replies are matched by serial; only refused calls are retried."""
+    print("\n🔍 DunstBackend._pipeline_notify(): replies matched by serial")
+    if not JEEPNEY_AVAILABLE:
+        print("   ⏭️  jeepney not installed, skipped")
+        return
+
+    backend = DunstBackend()
+    notifications = [
+        {"icon": "info", "title": f"n{i}", "message": "m", "urgency": "normal", "timeout": 1000}
+        for i in range(4)
+    ]
+
+    results = [False] * 4
+    retry = backend._pipeline_notify(FakeConnection(refuse={2}), notifications, results)
+    assert results == [True, False, True, True], results
+    assert retry == [1], retry
+
+    # Written but never answered: not confirmed, and not sent a second time
+    results = [False] * 4
+    retry = backend._pipeline_notify(FakeConnection(unanswered={4}), notifications, results)
+    assert results == [True, True, True, False], results
+    assert retry == [], retry
+    print("   ✅ refused call retried, unanswered call left alone")
+
+
+def main():
+    print(f"🔧 Batch and Background Delivery\n{'=' * 50}")
+
+    tests = [
+        test_send_many_order,
+        test_send_async_and_flush,
+        test_cancelled_future_dropped,
+        test_critical_first_per_id_order,
+        test_coalescing,
+        test_close_stops_sender,
+        test_pipeline_notify,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n{len(tests) - failed} of {len(tests)} checks passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Check the on-disk icon resolution cache (IconResolutionCache).
+
+Uses a temporary cache file and icon, so it does not touch
+$XDG_CACHE_HOME or need any icon theme installed.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from desktop_notify.iconsets.cache import IconResolutionCache
+from desktop_notify.types import IconResolutionInfo, IconResolutionSource
+
+SETTINGS = ("Papirus", 48, False)
+
+
+def _icon_info(name, path, source=IconResolutionSource.SYSTEM_THEME, **kwargs):
+    """Resolution of name to path."""
+    return IconResolutionInfo(original_name=name, resolved_path=str(path), source=source, **kwargs)
+
+
+def test_round_trip():
+    """Entries saved by one process are found by the next."""
+    print("\n🔍 Entries survive a save and reload")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "icons.json"
+        icon = Path(tmp) / "info.svg"
+        icon.write_text("<svg/>")
+
+        cache = IconResolutionCache(cache_path, SETTINGS)
+        cache.put("system", _icon_info("info", icon))
+        cache.put("system", _icon_info("party", "🎉", IconResolutionSource.UNICODE))
+        cache.save()
+
+        reloaded = IconResolutionCache(cache_path, SETTINGS)
+        info = reloaded.get("system", "info")
+        assert info is not None and info.resolved_path == str(icon) and info.cached
+        assert reloaded.get("system", "party").resolved_path == "🎉"
+        assert reloaded.get("material", "info") is None, "entries are per icon set"
+    print("   ✅ file and glyph entries reloaded")
+
+
+def test_stale_when_file_changes():
+    """An entry is dropped once the icon file's mtime changes."""
+    print("\n🔍 Entries go stale when the icon file changes")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "icons.json"
+        icon = Path(tmp) / "info.svg"
+        icon.write_text("<svg/>")
+
+        cache = IconResolutionCache(cache_path, SETTINGS)
+        cache.put("system", _icon_info("info", icon))
+        cache.save()
+
+        mtime = icon.stat().st_mtime
+        os.utime(icon, (mtime + 10, mtime + 10))
+        assert IconResolutionCache(cache_path, SETTINGS).get("system", "info") is None
+
+        icon.unlink()
+        cache.put("system", _icon_info("info", icon))
+        assert cache.get("system", "info") is None, "a missing file is not stored"
+    print("   ✅ changed and missing files are not served")
+
+
+def test_skips_fallbacks():
+    """Fallback and unresolved icons are not stored."""
+    print("\n🔍 Fallback resolutions are not stored")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = IconResolutionCache(Path(tmp) / "icons.json", SETTINGS)
+        cache.put("system", _icon_info("a", "🔔", IconResolutionSource.MINIMAL, is_fallback=True))
+        cache.put("system", _icon_info("b", "dialog-information", IconResolutionSource.FALLBACK))
+        cache.put("system", _icon_info("c", "c", IconResolutionSource.NOT_FOUND))
+
+        assert all(cache.get("system", name) is None for name in "abc")
+    print("   ✅ nothing stored")
+
+
+def test_other_settings_discarded():
+    """A file written with another theme, size or scalable setting is ignored."""
+    print("\n🔍 Cache built with other icon settings is discarded")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "icons.json"
+        cache = IconResolutionCache(cache_path, SETTINGS)
+        cache.put("system", _icon_info("party", "🎉", IconResolutionSource.UNICODE))
+        cache.save()
+
+        for settings in [("Adwaita", 48, False), ("Papirus", 64, False), ("Papirus", 48, True)]:
+            assert IconResolutionCache(cache_path, settings).get("system", "party") is None, settings
+
+        cache.use_fingerprint(("Adwaita", 48, False))
+        assert cache.get("system", "party") is None
+    print("   ✅ theme, size and scalable changes all invalidate")
+
+
+def test_ignores_malformed_file():
+    """Unreadable files and malformed entries are skipped."""
+    print("\n🔍 Malformed cache files are tolerated")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "icons.json"
+
+        cache_path.write_text("{not json")
+        assert IconResolutionCache(cache_path, SETTINGS).get("system", "x") is None
+
+        cache_path.write_text(json.dumps({
+            "fingerprint": list(SETTINGS),
+            "entries": {
+                "system\tgood": {"resolved_path": "🎉", "source": "unicode"},
+                "system\tstring": "🎉",
+                "system\tlist": ["🎉"],
+                "system\tbad_source": {"resolved_path": "🎉", "source": "nope"},
+            },
+        }))
+        cache = IconResolutionCache(cache_path, SETTINGS)
+        assert cache.get("system", "good").resolved_path == "🎉"
+        for name in ["string", "list", "bad_source"]:
+            assert cache.get("system", name) is None, name
+    print("   ✅ bad entries skipped, good ones kept")
+
+
+def main():
+    print(f"🔧 Icon Resolution Cache\n{'=' * 50}")
+
+    tests = [
+        test_round_trip,
+        test_stale_when_file_changes,
+        test_skips_fallbacks,
+        test_other_settings_discarded,
+        test_ignores_malformed_file,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"   ❌ {test.__name__} failed: {e}")
+
+    print(f"\n{len(tests) - failed} of {len(tests)} checks passed")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    exit(main())